@@ -0,0 +1,6 @@
+import sys
+
+
+# Keyword arguments for @dataclass that store fields in slots instead of a
+# per-instance __dict__ where dataclasses support it (3.10+).
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -1,9 +1,35 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import ClassVar, List, Optional, Sequence, Union
 
+from .compat import DATACLASS_SLOTS
+from .pattern.common.copper import roundrect_ratio
 
-@dataclass
+
+# A library run creates thousands of shapes, so they are stored in slots
+# where dataclasses support it (see compat.DATACLASS_SLOTS).
+@dataclass(**DATACLASS_SLOTS)
 class PatternShape:
+    # Derived pad geometry. Computed on access (not cached) because builders may
+    # still resize a pad after placement (e.g. SON's widened pin 1). Declared before
+    # the fields since the `property` field shadows the builtin in the class body.
+    @property
+    def half_width(self) -> float:
+        return self.width * 0.5
+
+    @property
+    def half_height(self) -> float:
+        return self.height * 0.5
+
+    @property
+    def extent_x(self) -> float:
+        """Distance of the outer X edge from the footprint origin."""
+        return abs(self.x) + self.width * 0.5
+
+    @property
+    def extent_y(self) -> float:
+        """Distance of the outer Y edge from the footprint origin."""
+        return abs(self.y) + self.height * 0.5
+
     kind: str
     # Generic attributes used by writer, mirror of QedaPattern shapes
     x: float = 0.0
@@ -40,6 +66,60 @@ class PatternShape:
     pad_name: Optional[str] = None
 
 
+# Graphic items only ever need a handful of PatternShape's fields, so they get their
+# own slim records; `kind` is a class attribute, letting write_kicad_mod() dispatch on
+# it as before. Pads keep the full PatternShape (builders edit them after placement).
+@dataclass(**DATACLASS_SLOTS)
+class LineShape:
+    kind: ClassVar[str] = 'line'
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    lineWidth: float
+    layer: Sequence[str]
+
+
+@dataclass(**DATACLASS_SLOTS)
+class RectShape:
+    kind: ClassVar[str] = 'rectangle'
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    lineWidth: float
+    layer: Sequence[str]
+    fill: bool = False
+
+
+@dataclass(**DATACLASS_SLOTS)
+class CircleShape:
+    kind: ClassVar[str] = 'circle'
+    x: float
+    y: float
+    radius: float
+    lineWidth: float
+    layer: Sequence[str]
+    fill: bool = False
+
+
+@dataclass(**DATACLASS_SLOTS)
+class AttributeShape:
+    kind: ClassVar[str] = 'attribute'
+    name: str
+    x: float
+    y: float
+    text: Optional[str]
+    fontSize: Optional[float]
+    angle: Optional[float]
+    visible: Optional[bool]
+    lineWidth: float
+    layer: Sequence[str]
+
+
+Shape = Union[PatternShape, LineShape, RectShape, CircleShape, AttributeShape]
+
+
 def _fmt(x: float, decimals: int) -> str:
     return f"{x:.{decimals}f}"
 
@@ -63,7 +143,7 @@ def _map_layers(layers: List[str]) -> str:
     return " ".join(table[l] for l in layers)
 
 
-def write_kicad_mod(module_name: str, shapes: List[PatternShape], pattern_type: str, decimals: int, model: Optional[dict] = None, descr: Optional[str] = None, tags: Optional[str] = None) -> str:
+def write_kicad_mod(module_name: str, shapes: List[Shape], pattern_type: str, decimals: int, model: Optional[dict] = None, descr: Optional[str] = None, tags: Optional[str] = None) -> str:
     lines: List[str] = []
     lines.append(f"(module {module_name} (layer F.Cu)")
     if descr:
@@ -138,11 +218,7 @@ def write_kicad_mod(module_name: str, shapes: List[PatternShape], pattern_type:
             
             # Add roundrect_rratio for roundrect pads
             if shape == 'roundrect':
-                pad_w = s.width
-                pad_h = s.height
-                min_dimension = min(pad_w, pad_h)
-                rratio = min(0.25, 0.1 / min_dimension)
-                line += f"\n    (roundrect_rratio {_fmt(rratio, 10)})"
+                line += f"\n    (roundrect_rratio {_fmt(roundrect_ratio(s.width, s.height), 10)})"
             
             if s.slotWidth is not None and s.slotHeight is not None:
                 line += f"\n    (drill oval {_fmt(s.slotWidth, decimals)} {_fmt(s.slotHeight, decimals)})"
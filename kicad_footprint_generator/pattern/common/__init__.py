@@ -1,19 +1,29 @@
+from . import assembly
 from . import calculator
 from . import copper
 from . import courtyard
 from . import silkscreen
 from . import mask
 
+
+def _needs_name(pattern):
+    """True while no builder (or caller) has named the pattern yet."""
+    return not pattern.__dict__.get('name')
+
+
+def _needs_description(pattern):
+    return 'description' not in pattern.__dict__
+
+
+# Density level -> wording used in footprint descriptions
+DENSITY_NAMES = {'L': 'Least', 'N': 'Nominal', 'M': 'Most'}
+
+
 # helper facades mirroring Coffee structure
 
 class grid_array:
     @staticmethod
     def build(pattern, element):
-        from . import calculator as calc
-        from . import copper as cu
-        from . import courtyard as cy
-        from . import assembly as asm
-        from . import silkscreen as ss
         housing = element['housing']
         settings = pattern.settings
         lead_count = housing.get('leadCount') or len(element['pins'])
@@ -29,7 +39,7 @@ class grid_array:
             abbr, option = 'LGA', 'lga'
         else:
             abbr, option = 'BGA', 'bga'
-        if not getattr(pattern, 'name', None):
+        if _needs_name(pattern):
             if option == 'bga':
                 pitch = int(round(housing['pitch'] * 100))
                 cols = housing['columnCount']
@@ -56,28 +66,23 @@ class grid_array:
                 pattern.name = f"{abbr}{lead_count}P{pitch}_{cols}X{rows}_{bl:03d}X{bw:03d}X{bh:03d}{ld_h:03d}{settings['densityLevel']}"
         housing.setdefault('verticalPitch', housing['pitch'])
         housing.setdefault('horizontalPitch', housing['pitch'])
-        pad_params = calc.grid_array(pattern.__dict__, housing, option)
+        pad_params = calculator.grid_array(pattern.__dict__, housing, option)
         pad = {
             'type': 'smd',
             'width': pad_params['width'],
             'height': pad_params['height'],
             'shape': 'rectangle' if housing.get('lga') else 'circle',
-            'layer': ['topCopper', 'topMask', 'topPaste'],
+            'layer': copper.LAYERS_SMD_TOP,
         }
-        cu.grid_array(pattern, element, pad)
-        ss.grid_array(pattern, housing)
-        asm.body(pattern, housing)
-        cy.grid_array(pattern, housing, pad_params['courtyard'])
+        copper.grid_array(pattern, element, pad)
+        silkscreen.grid_array(pattern, housing)
+        assembly.body(pattern, housing)
+        courtyard.grid_array(pattern, housing, pad_params['courtyard'])
 
 
 class dual:
     @staticmethod
     def build(pattern, element):
-        from . import calculator as calc
-        from . import copper as cu
-        from . import courtyard as cy
-        from . import silkscreen as ss
-        from . import mask as mk
         housing = element['housing']
         settings = pattern.settings
         lead_count = 0
@@ -100,7 +105,7 @@ class dual:
             abbr, option = 'SON', 'son'
         else:
             abbr, option = 'SOP', 'sop'
-        if not getattr(pattern, 'name', None):
+        if _needs_name(pattern):
             pitch_h = int(round(housing['pitch'] * 100))
             ls = int(round(housing['leadSpan']['nom'] * 100))
             bw = int(round(housing['bodyWidth']['nom'] * 100))
@@ -123,7 +128,7 @@ class dual:
         # Description/tags: generate if missing/empty (even when name was pre-set by UI).
         if not getattr(pattern, 'description', None):
             try:
-                density_desc = {'L': 'Least', 'N': 'Nominal', 'M': 'Most'}[settings['densityLevel']]
+                density_desc = DENSITY_NAMES[settings['densityLevel']]
             except Exception:
                 density_desc = 'Nominal'
 
@@ -185,42 +190,33 @@ class dual:
                 f"{body_part}{ls_part}{lead_part}, {density_desc} Density"
             )
             pattern.tags = tags
-        pad_params = calc.dual(pattern.__dict__, housing, option)
+        pad_params = calculator.dual(pattern.__dict__, housing, option)
         pad_params['order'] = 'round'
         pad_params['pad'] = {
             'type': 'smd',
             'shape': 'rectangle',
             'width': pad_params['width'],
             'height': pad_params['height'],
-            'layer': ['topCopper', 'topMask', 'topPaste'],
+            'layer': copper.LAYERS_SMD_TOP,
         }
-        cu.dual(pattern, element, pad_params)
-        ss.dual(pattern, housing)
+        copper.dual(pattern, element, pad_params)
+        silkscreen.dual(pattern, housing)
         if housing.get('polarized'):
-            from . import assembly as asm
             if housing.get('soic'):
                 # SOIC uses SOP-style assembly (no chamfer, pin1 dot)
-                asm.sop(pattern, housing)
+                assembly.sop(pattern, housing)
             else:
-                asm.polarized(pattern, housing)
+                assembly.polarized(pattern, housing)
         else:
-            from . import assembly as asm
-            asm.body(pattern, housing)
-        cy.dual(pattern, housing, pad_params['courtyard'])
-        mk.dual(pattern, housing)
-        from . import copper as cu2
-        cu2.tab(pattern, element) if hasattr(cu2, 'tab') else None
+            assembly.body(pattern, housing)
+        courtyard.dual(pattern, housing, pad_params['courtyard'])
+        mask.dual(pattern, housing)
+        copper.tab(pattern, element) if hasattr(copper, 'tab') else None
 
 
 class quad:
     @staticmethod
     def build(pattern, element):
-        from . import calculator as calc
-        from . import copper as cu
-        from . import courtyard as cy
-        from . import silkscreen as ss
-        from . import mask as mk
-        from . import assembly as asm
         housing = element['housing']
         settings = pattern.settings
         lead_count = housing.get('leadCount')
@@ -276,7 +272,7 @@ class quad:
             actual_pin_count = 2 * (rc + cc) if (rc and cc) else len(element['pins'])
 
         # Name: only generate when not already provided (allows UI name override).
-        if not getattr(pattern, 'name', None):
+        if _needs_name(pattern):
             pitch_h = int(round(housing['pitch'] * 100))
             l_h = int(round(length * 100))
             w_h = int(round(width * 100))
@@ -289,7 +285,7 @@ class quad:
         if not getattr(pattern, 'description', None):
             pitch = housing['pitch']
             h = housing['height']['max']
-            density_desc = {'L': 'Least', 'N': 'Nominal', 'M': 'Most'}[settings['densityLevel']]
+            density_desc = DENSITY_NAMES[settings['densityLevel']]
 
             thermal_desc = ""
             if t_suffix:  # Thermal pad present
@@ -320,14 +316,14 @@ class quad:
                                  f"Lead {ll:.2f}mm x {lw:.2f}mm{thermal_desc}, {density_desc} Density")
             pattern.tags = tags
 
-        pad_params = calc.quad(pattern.__dict__, housing, option)
+        pad_params = calculator.quad(pattern.__dict__, housing, option)
         row_pad = {
             'type': 'smd',
             'shape': 'rectangle',
             'width': pad_params['width1'],
             'height': pad_params['height1'],
             'distance': pad_params['distance1'],
-            'layer': ['topCopper', 'topMask', 'topPaste'],
+            'layer': copper.LAYERS_SMD_TOP,
         }
         column_pad = {
             'type': 'smd',
@@ -335,30 +331,25 @@ class quad:
             'width': pad_params['height2'],
             'height': pad_params['width2'],
             'distance': pad_params['distance2'],
-            'layer': ['topCopper', 'topMask', 'topPaste'],
+            'layer': copper.LAYERS_SMD_TOP,
         }
-        cu.quad(pattern, element, {
+        copper.quad(pattern, element, {
             'rowPad': row_pad,
             'columnPad': column_pad,
             'distance1': pad_params['distance1'],
             'distance2': pad_params['distance2'],
         })
-        ss.quad(pattern, housing)
-        asm.quad(pattern, housing)
+        silkscreen.quad(pattern, housing)
+        assembly.quad(pattern, housing)
         # Flexible courtyard around body and pads (step 1: separate rectangles)
-        cy.boundary_flex(pattern, housing, pad_params['courtyard'])
-        mk.quad(pattern, housing)
-        cu.tab(pattern, element)
+        courtyard.boundary_flex(pattern, housing, pad_params['courtyard'])
+        mask.quad(pattern, housing)
+        copper.tab(pattern, element)
 
 
 class two_pin:
     @staticmethod
     def build(pattern, element):
-        from . import calculator as calc
-        from . import courtyard as cy
-        from . import silkscreen as ss
-        from . import assembly as asm
-        from . import mask as mk
         housing = element['housing']
         settings = pattern.settings
         height = housing.get('height', {}).get('max', housing.get('bodyDiameter', {}).get('max'))
@@ -412,10 +403,10 @@ class two_pin:
             option = 'chip'
             size = f"{int(round(housing['bodyLength']['nom']*10)):02d}{int(round(housing['bodyWidth']['nom']*10)):02d}X{int(round(height*100))}"
 
-        if not getattr(pattern, 'name', None):
+        if _needs_name(pattern):
             pattern.name = f"{abbr}{size}{settings['densityLevel']}"
 
-        pad_params = calc.two_pin(pattern.__dict__, housing, option)
+        pad_params = calculator.two_pin(pattern.__dict__, housing, option)
         # CAE: pins must be left (1) and right (2)
         if housing.get('cae'):
             pad = {
@@ -433,7 +424,7 @@ class two_pin:
                 pad['layer'] = ['topCopper', 'topMask', 'intCopper', 'bottomCopper', 'bottomMask']
             else:
                 pad['type'] = 'smd'
-                pad['layer'] = ['topCopper', 'topMask', 'topPaste']
+                pad['layer'] = copper.LAYERS_SMD_TOP
             pattern.pad(1, pad)
             pad2 = dict(pad)
             pad2['x'] = -pad['x']
@@ -458,7 +449,7 @@ class two_pin:
                     pad['layer'] = ['topCopper', 'topMask', 'intCopper', 'bottomCopper', 'bottomMask']
                 else:
                     pad['type'] = 'smd'
-                    pad['layer'] = ['topCopper', 'topMask', 'topPaste']
+                    pad['layer'] = copper.LAYERS_SMD_TOP
 
                 pattern.pad(1, pad)
                 pad2 = dict(pad)
@@ -483,7 +474,7 @@ class two_pin:
                     pad['layer'] = ['topCopper', 'topMask', 'intCopper', 'bottomCopper', 'bottomMask']
                 else:
                     pad['type'] = 'smd'
-                    pad['layer'] = ['topCopper', 'topMask', 'topPaste']
+                    pad['layer'] = copper.LAYERS_SMD_TOP
 
                 pattern.pad(1, pad)
                 pad2 = dict(pad)
@@ -491,13 +482,12 @@ class two_pin:
                 if 'hole' in pad2:
                     pad2['shape'] = 'circle'
                 pattern.pad(2, pad2)
-        from . import copper as cu
-        cu.mask(pattern)
-        ss.two_pin(pattern, housing)
-        asm.two_pin(pattern, housing)
+        copper.mask(pattern)
+        silkscreen.two_pin(pattern, housing)
+        assembly.two_pin(pattern, housing)
         if housing.get('cae'):
-            cy.boundary(pattern, housing, pad_params['courtyard'])
+            courtyard.boundary(pattern, housing, pad_params['courtyard'])
         else:
-            cy.two_pin(pattern, housing, pad_params['courtyard'])
-        mk.two_pin(pattern, housing)
+            courtyard.two_pin(pattern, housing, pad_params['courtyard'])
+        mask.two_pin(pattern, housing)
 
@@ -151,7 +151,7 @@ def quad(pattern, housing):
     dot_y = -y + dot_offset  # 0.8mm from top edge toward center
     
     # Draw the dot (circle with 0.2mm radius, 0.1mm line width, filled)
-    pattern.layer('topAssembly').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+    pattern.filled_circle('topAssembly', 0.1, dot_x, dot_y, 0.2)
 
 
 def son(pattern, housing):
@@ -171,7 +171,7 @@ def son(pattern, housing):
     dot_y = -y + dot_offset  # 0.5mm from top edge toward center
     
     # Draw the dot (circle with 0.2mm radius, 0.1mm line width, filled)
-    pattern.layer('topAssembly').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+    pattern.filled_circle('topAssembly', 0.1, dot_x, dot_y, 0.2)
 
 
 def sot23(pattern, housing):
@@ -259,7 +259,7 @@ def sot23(pattern, housing):
     dot_y = -y + dot_offset  # 0.5mm from top edge toward center
     
     # Draw the dot (circle with 0.2mm radius, 0.1mm line width, filled)
-    pattern.layer('topAssembly').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+    pattern.filled_circle('topAssembly', 0.1, dot_x, dot_y, 0.2)
 
 
 def sop(pattern, housing):
@@ -348,7 +348,7 @@ def sop(pattern, housing):
     dot_y = -y + dot_offset  # 0.5mm from top edge toward center
     
     # Draw the dot (circle with 0.2mm radius, 0.1mm line width, filled)
-    pattern.layer('topAssembly').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+    pattern.filled_circle('topAssembly', 0.1, dot_x, dot_y, 0.2)
 
 
 def corner_concave(pattern, housing):
@@ -368,7 +368,7 @@ def corner_concave(pattern, housing):
     dot_y = y - dot_offset   # 0.5mm from top edge toward center (top-left corner)
     
     # Draw the dot (circle with 0.2mm radius, 0.1mm line width, filled)
-    pattern.layer('topAssembly').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+    pattern.filled_circle('topAssembly', 0.1, dot_x, dot_y, 0.2)
 
 
 def sodfl_preamble(pattern, housing):
@@ -398,10 +398,8 @@ def sodfl_preamble(pattern, housing):
     
     # Calculate text position using real pad positions (similar to chip)
     if pattern.pads:
-        pad_extent = 0
-        for pad in pattern.pads.values():
-            # Calculate the farthest point of each pad from center
-            pad_extent = max(pad_extent, abs(pad.y) + pad.height / 2)
+        # Farthest point of any pad from center
+        pad_extent = max(pad.extent_y for pad in pattern.pads.values())
         
         if pad_extent == 0:
             pad_extent = 0.7  # fallback if no pads found
@@ -484,7 +482,7 @@ def sodfl(pattern, housing):
     dot_y = -y + dot_offset  # 0.5mm from bottom edge toward center (bottom-left corner)
     
     # Draw the dot (circle with 0.2mm radius, 0.1mm line width, filled)
-    pattern.layer('topAssembly').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+    pattern.filled_circle('topAssembly', 0.1, dot_x, dot_y, 0.2)
 
 
 def molded_preamble(pattern, housing):
@@ -513,10 +511,8 @@ def molded_preamble(pattern, housing):
     
     # Calculate text position using real pad positions (similar to chip)
     if pattern.pads:
-        pad_extent = 0
-        for pad in pattern.pads.values():
-            # Calculate the farthest point of each pad from center
-            pad_extent = max(pad_extent, abs(pad.y) + pad.height / 2)
+        # Farthest point of any pad from center
+        pad_extent = max(pad.extent_y for pad in pattern.pads.values())
         
         if pad_extent == 0:
             pad_extent = 0.7  # fallback if no pads found
@@ -599,7 +595,7 @@ def molded(pattern, housing):
     dot_y = -y + dot_offset  # 0.4mm from bottom edge toward center (bottom-left corner)
     
     # Draw the dot (circle with 0.2mm radius, 0.1mm line width, filled)
-    pattern.layer('topAssembly').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+    pattern.filled_circle('topAssembly', 0.1, dot_x, dot_y, 0.2)
 
 
 def chip_preamble(pattern, housing):
@@ -629,10 +625,8 @@ def chip_preamble(pattern, housing):
     
     # Calculate text position using real pad positions (similar to QFP)
     if pattern.pads:
-        pad_extent = 0
-        for pad in pattern.pads.values():
-            # Calculate the farthest point of each pad from center
-            pad_extent = max(pad_extent, abs(pad.y) + pad.height / 2)
+        # Farthest point of any pad from center
+        pad_extent = max(pad.extent_y for pad in pattern.pads.values())
         
         if pad_extent == 0:
             pad_extent = 0.7  # fallback if no pads found
@@ -781,5 +775,5 @@ def dfn_molded_style(pattern, housing):
     dot_offset = 0.4
     dot_x = -x + dot_offset
     dot_y = -y + dot_offset
-    pattern.layer('topAssembly').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+    pattern.filled_circle('topAssembly', 0.1, dot_x, dot_y, 0.2)
 
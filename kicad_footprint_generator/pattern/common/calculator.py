@@ -1126,6 +1126,10 @@ def _sot_gullwing(pattern: dict, housing: dict) -> dict:
     return params
 
 
+# sot()/sotfl() are deliberately not memoized: besides the housing they read the
+# density, tolerances, clearances, preferManufacturer and the pattern's toe/heel/side/
+# courtyard/roundoff overrides, and they write back to both dicts (leadWidth*,
+# sizeRoundoff). A correct cache key would be as costly as the arithmetic it skips.
 def sot(pattern: dict, housing: dict) -> dict:
     settings = pattern['settings']
     # adapt leadWidth to leadWidth1 like CoffeeScript
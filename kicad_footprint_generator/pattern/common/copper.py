@@ -1,3 +1,7 @@
+# Shared, read-only layer set for top-side SMD pads; copy before mutating
+LAYERS_SMD_TOP = ('topCopper', 'topMask', 'topPaste')
+
+
 def preamble(pattern, element):
     housing = element['housing']
     body_position = housing.get('bodyPosition', '0, 0')
@@ -88,6 +92,43 @@ def dual(pattern, element, pad_params):
     postscriptum(pattern)
 
 
+def roundrect_ratio(width, height):
+    # roundrect_rratio written by kicad_writer for roundrect pads:
+    # 0.1 mm corner radius, capped at a quarter of the shorter side
+    return min(0.25, 0.1 / min(width, height))
+
+
+def roundrect_rows(pattern, housing, pad_params):
+    # SOP-style rows: pins 1..n/2 down the left side, n/2+1..n back up the right side
+    pin_count = int(housing['leadCount'])
+    pins_per_side = pin_count // 2
+    pitch = housing['pitch']
+    pad_distance = pad_params['distance']
+
+    # pattern.pad() copies the template, so one dict is reused for every pin
+    pad = {
+        'type': 'smd',
+        'shape': 'roundrect',
+        'width': pad_params['width'],
+        'height': pad_params['height'],
+        'layer': LAYERS_SMD_TOP,
+    }
+
+    # Row positions are shared by both sides; computed per index, not accumulated
+    half = (pins_per_side - 1) * pitch / 2
+    ys = [i * pitch - half for i in range(pins_per_side)]
+    pad['x'] = -pad_distance / 2
+    for i, y in enumerate(ys):
+        pad['y'] = y
+        pattern.pad(i + 1, pad)
+
+    # Right side counts down from the highest pin
+    pad['x'] = pad_distance / 2
+    for i, y in enumerate(ys):
+        pad['y'] = y
+        pattern.pad(pin_count - i, pad)
+
+
 def grid_array(pattern, element, pad):
     housing = element['housing']
     v_pitch = housing['verticalPitch']
@@ -183,7 +224,7 @@ def tab(pattern, element):
     tab_number = int(base_count) + 1
     if has_tab:
         housing.setdefault('tabPosition', '0, 0')
-        points = pattern.parse_position(housing['tabPosition'])
+        points = pattern.parse_points(housing['tabPosition'])
         # Resolve tab size; treat zero-sized as absent
         tw = housing.get('tabWidth')
         tl = housing.get('tabLength')
@@ -197,31 +238,30 @@ def tab(pattern, element):
             tab_l = float(tl or 0)
         if tab_w <= 0 or tab_l <= 0:
             return
-        for i, p in enumerate(points):
-            tab_pad = {
-                'type': 'smd',
-                'shape': 'rectangle',
-                'width': tab_w,
-                'height': tab_l,
-                'layer': ['topCopper', 'topMask', 'topPaste'],
-                'x': p['x'],
-                'y': p['y'],
-            }
+        tab_pad = {
+            'type': 'smd',
+            'shape': 'rectangle',
+            'width': tab_w,
+            'height': tab_l,
+            'layer': LAYERS_SMD_TOP,
+        }
+        for i, (x, y) in enumerate(points):
+            tab_pad['x'] = x
+            tab_pad['y'] = y
             pattern.pad(tab_number + i, tab_pad)
         mask(pattern)
     if 'viaDiameter' in housing:
         via_diameter = housing['viaDiameter']
-        points = pattern.parse_position(housing['viaPosition'])
-        for p in points:
-            via_pad = {
-                'type': 'through-hole',
-                'shape': 'circle',
-                'hole': via_diameter,
-                'width': via_diameter + 0.1,
-                'height': via_diameter + 0.1,
-                'layer': ['topCopper', 'intCopper', 'bottomCopper'],
-                'x': p['x'],
-                'y': p['y'],
-            }
+        via_pad = {
+            'type': 'through-hole',
+            'shape': 'circle',
+            'hole': via_diameter,
+            'width': via_diameter + 0.1,
+            'height': via_diameter + 0.1,
+            'layer': ['topCopper', 'intCopper', 'bottomCopper'],
+        }
+        for x, y in pattern.parse_points(housing['viaPosition']):
+            via_pad['x'] = x
+            via_pad['y'] = y
             pattern.pad(tab_number, via_pad)
 
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+
+from ...compat import DATACLASS_SLOTS
+
+
+def resolve_range(val, prefer='nom'):
+    """Value of a {'min', 'nom', 'max'} range, falling back to max then min; plain numbers pass through."""
+    if isinstance(val, dict):
+        return val.get(prefer, val.get('max', val.get('min', 0)))
+    return float(val or 0)
+
+
+def midpoint_nom(val):
+    """Nominal value of a range, or the midpoint of its limits when no nominal is given."""
+    if isinstance(val, dict):
+        return val.get('nom', (val.get('min', 0) + val.get('max', 0)) / 2)
+    return float(val or 0)
+
+
+def nominal(val):
+    """Nominal value of a range, 0 when absent; plain numbers pass through."""
+    if isinstance(val, dict):
+        return val.get('nom', 0)
+    return float(val or 0)
+
+
+def hundredths(v):
+    """Dimension in 0.01 mm units, as used in IPC-style footprint names (round-half-even)."""
+    return round(v * 100)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class HousingDims:
+    """Body and lead dimensions read once and shared by a footprint's name and description.
+
+    Body length/width and lead span are nominal, height is the maximum, and
+    ``lead`` picks how the leadLength/leadWidth ranges are resolved.
+    """
+    bl: float
+    bw: float
+    bh: float
+    ls: float
+    ll: float
+    lw: float
+
+    @classmethod
+    def extract(cls, housing, lead=nominal):
+        height = housing.get('height')
+        return cls(
+            bl=nominal(housing.get('bodyLength')),
+            bw=nominal(housing.get('bodyWidth')),
+            bh=height.get('max', 0) if isinstance(height, dict) else float(height or 0),
+            ls=nominal(housing.get('leadSpan')),
+            ll=lead(housing.get('leadLength')),
+            lw=lead(housing.get('leadWidth')),
+        )
+
+    @property
+    def bl_h(self):
+        return hundredths(self.bl)
+
+    @property
+    def bw_h(self):
+        return hundredths(self.bw)
+
+    @property
+    def bh_h(self):
+        return hundredths(self.bh)
+
+    @property
+    def ls_h(self):
+        return hundredths(self.ls)
+
+    @property
+    def ll_h(self):
+        return hundredths(self.ll)
+
+    @property
+    def lw_h(self):
+        return hundredths(self.lw)
@@ -1,4 +1,20 @@
 import os
+from functools import lru_cache
+from operator import attrgetter
+
+
+# dual(): housings drawn as top/bottom lines only, and the subset whose pin-1 dot
+# is aligned with pad 1's X position.
+_SMALL_IC_KEYS = frozenset(('son', 'sot23', 'sop', 'soj', 'soic'))
+_ALIGNED_DOT_KEYS = frozenset(('sot23', 'sop', 'soj', 'soic'))
+
+
+def _debug_enabled() -> bool:
+    try:
+        v = str(os.environ.get("KICAD_FOOTPRINT_GENERATOR_DEBUG", "") or "").strip().lower()
+    except Exception:
+        v = ""
+    return v in ("1", "true", "yes", "on")
 
 
 def _dbg(msg: str) -> None:
@@ -9,17 +25,32 @@ def _dbg(msg: str) -> None:
     Enable explicitly via:
       KICAD_FOOTPRINT_GENERATOR_DEBUG=1
     """
-    try:
-        v = str(os.environ.get("KICAD_FOOTPRINT_GENERATOR_DEBUG", "") or "").strip().lower()
-    except Exception:
-        v = ""
-    if v in ("1", "true", "yes", "on"):
+    if _debug_enabled():
         try:
             print(msg)
         except Exception:
             pass
 
 
+@lru_cache(maxsize=1024)
+def _text_y_for(body_y: float, pad_extent: float) -> float:
+    """refDes Y position above the larger of the body half-size and the pad extent."""
+    return -(max(body_y, pad_extent) + 1.25)
+
+
+@lru_cache(maxsize=256)
+def _body_box(bl: float, bw: float, lw: float):
+    """(left, right, top, bottom) silkscreen outline of a chip-oriented body: x spans bl, y spans bw."""
+    body_x = bl / 2
+    body_y = bw / 2
+    return (-body_x - lw / 2, body_x + lw / 2, body_y + lw / 2, -body_y - lw / 2)
+
+
+def _draw_polarity_dot(pattern, x, y, r=0.2, lw=0.1):
+    """Filled pin-1 dot on the top silkscreen (0.2mm radius, 0.1mm line width by default)."""
+    pattern.filled_circle('topSilkscreen', lw, x, y, r)
+
+
 def preamble(pattern, housing):
     line_width = pattern.settings['lineWidth']['silkscreen']
     
@@ -32,14 +63,13 @@ def preamble(pattern, housing):
         if pattern.pads:
             for pad in pattern.pads.values():
                 # Calculate the farthest point of each pad from center
-                pad_top = pad.y + pad.height / 2
+                pad_top = pad.y + pad.half_height
                 pad_extent = max(pad_extent, abs(pad_top))
         
         if pad_extent == 0:
             pad_extent = 0.7  # fallback if no pads found
         
-        courtyard = pattern.settings.get('clearance', {}).get('courtyard', 0.25)
-        text_y = -(max(body_y, pad_extent) + 1.25)
+        text_y = _text_y_for(body_y, pad_extent)
     else:
         text_y = -1.5  # fallback
     
@@ -64,19 +94,16 @@ def chip_preamble(pattern, housing):
     
     # Calculate text position using real pad positions (similar to QFP)
     if pattern.pads:
-        pad_extent = 0
-        for pad in pattern.pads.values():
-            # Calculate the farthest point of each pad from center
-            # For chip (horizontal layout), use Y extent
-            pad_extent = max(pad_extent, abs(pad.y) + pad.height / 2)
+        # Farthest point of any pad from center.
+        # For chip (horizontal layout), use Y extent
+        pad_extent = max(pad.extent_y for pad in pattern.pads.values())
         
         if pad_extent == 0:
             pad_extent = 0.7  # fallback if no pads found
         
         # Use chip body dimensions for comparison
         body_y = housing['bodyWidth']['nom'] / 2  # For chip, body width becomes Y extent
-        courtyard = pattern.settings.get('clearance', {}).get('courtyard', 0.25)
-        text_y = -(max(body_y, pad_extent) + 1.25)
+        text_y = _text_y_for(body_y, pad_extent)
     else:
         text_y = -1.5  # fallback
     
@@ -109,20 +136,25 @@ def dual(pattern, housing):
     lw = s['lineWidth']['silkscreen']
     w = housing['bodyWidth']['nom']
     l = housing['bodyLength']['nom']
-    first_pad = list(pattern.pads.values())[0]
+    first_pad = next(iter(pattern.pads.values()))
     gap = lw / 2 + s['clearance']['padToSilk']
     x1 = -w / 2 - lw / 2
     x2 = -x1
     yb = -l / 2 - lw / 2
-    xf = first_pad.x - first_pad.width / 2 - gap
-    yf = first_pad.y - first_pad.height / 2 - gap
+    xf = first_pad.x - first_pad.half_width - gap
+    yf = first_pad.y - first_pad.half_height - gap
     y1 = min(yb, yf)
     y2 = -y1
     xp = first_pad.x
     yp = (yf if xp < x1 else y1) - 1.5 * lw
+    # Housing flags are fixed for the whole call; classify once.
+    polarized = housing.get('polarized')
+    small_ic_flags = {k for k in _SMALL_IC_KEYS if housing.get(k)}
+    is_small_ic = bool(small_ic_flags)
+    is_sot_like = not _ALIGNED_DOT_KEYS.isdisjoint(small_ic_flags)
     preamble(pattern, housing)
     
-    if housing.get('son') or housing.get('sot23') or housing.get('sop') or housing.get('soj') or housing.get('soic'):
+    if is_small_ic:
         # SON/SOT-23/SOP/SOIC-specific: only draw horizontal lines (top and bottom)
         # Lines should be close to body edges, not based on pad positions
         body_left = -w / 2
@@ -130,13 +162,15 @@ def dual(pattern, housing):
         # Use body-relative positioning with small offset (like SOP)
         body_y1 = -l / 2 - lw / 2  # bottom line (body bottom edge - line width)
         body_y2 = l / 2 + lw / 2   # top line (body top edge + line width)
-        pattern.line(body_left, body_y1, body_right, body_y1)  # bottom horizontal line
-        pattern.line(body_left, body_y2, body_right, body_y2)  # top horizontal line
+        pattern.lines((
+            (body_left, body_y1, body_right, body_y1),  # bottom horizontal line
+            (body_left, body_y2, body_right, body_y2),  # top horizontal line
+        ))
         
         # Add pin 1 indicator similar to QFP
-        if housing.get('polarized'):
+        if polarized:
             # Get first pad and silk clearance (same as QFP)
-            pad1 = list(pattern.pads.values())[0]
+            pad1 = next(iter(pattern.pads.values()))
             pad1_x = pad1.x
             pad1_y = pad1.y
             pad1_size_y = pad1.height
@@ -146,7 +180,7 @@ def dual(pattern, housing):
             dot1_y = pad1_y - pad1_size_y/2 - 0.25 - silk_to_pad_clearance
             
             # X position: align with the top-left pad x position
-            if housing.get('sot23') or housing.get('sop') or housing.get('soj') or housing.get('soic'):
+            if is_sot_like:
                 dot1_x = pad1_x  # Aligned with the first pad's X position
             else:
                 dot1_x = body_left - 0.25 - silk_to_pad_clearance
@@ -181,13 +215,12 @@ def dual(pattern, housing):
             if dot1_x < max_left_offset:
                 dot1_x = max_left_offset
             
-            # Circle with 0.2mm radius, 0.1mm line width, filled
-            pattern.layer('topSilkscreen').lineWidth(0.1).fill(True).circle(dot1_x, dot1_y, 0.2).fill(False)
+            _draw_polarity_dot(pattern, dot1_x, dot1_y)
     else:
         # Standard dual: draw full rectangle
         pattern.rectangle(x1, y1, x2, y2)
     
-    if housing.get('polarized') and not housing.get('son') and not housing.get('sot23') and not housing.get('sop') and not housing.get('soj') and not housing.get('soic'):
+    if polarized and not is_small_ic:
         pattern.attribute('value', {'text': pattern.name, 'x': 0, 'y': 0})
         pattern.circle(xp, yp, 0)  # polarityMark abstraction skipped; use small dot if needed
 
@@ -210,71 +243,68 @@ def corner_concave(pattern, housing):
     if len(pads) >= 4:
         # Find pads by position (assuming standard corner concave layout)
         # Pad 1: bottom-left, Pad 3: top-left, Pad 4: top-right, Pad 2: bottom-right
-        pad_positions = {}
+        # Quadrant index is (x > 0) << 1 | (y > 0): 0=BL, 1=TL, 2=BR, 3=TR
+        corners = [None] * 4
         for pad in pads:
-            if pad.x < 0 and pad.y < 0:  # bottom-left
-                pad_positions['bottom_left'] = pad
-            elif pad.x < 0 and pad.y > 0:  # top-left  
-                pad_positions['top_left'] = pad
-            elif pad.x > 0 and pad.y > 0:  # top-right
-                pad_positions['top_right'] = pad
-            elif pad.x > 0 and pad.y < 0:  # bottom-right
-                pad_positions['bottom_right'] = pad
+            if pad.x and pad.y:  # pads on an axis belong to no corner
+                corners[((pad.x > 0) << 1) | (pad.y > 0)] = pad
+        bottom_left, top_left, bottom_right, top_right = corners
         
         preamble(pattern, housing)
         
         # Draw horizontal lines (top and bottom) - positioned outside body edges like QFP/QFN
         body_top = l / 2 + lw / 2
         body_bottom = -l / 2 - lw / 2
+        segments = []
         
         # Top line: outside body top edge
-        if 'top_left' in pad_positions and 'top_right' in pad_positions:
-            left_pad = pad_positions['top_left']
-            right_pad = pad_positions['top_right']
-            line_start_x = left_pad.x + left_pad.width/2 + silk_pad_offset
-            line_end_x = right_pad.x - right_pad.width/2 - silk_pad_offset
+        if top_left and top_right:
+            left_pad = top_left
+            right_pad = top_right
+            line_start_x = left_pad.x + left_pad.half_width + silk_pad_offset
+            line_end_x = right_pad.x - right_pad.half_width - silk_pad_offset
             if line_end_x > line_start_x:
-                pattern.line(line_start_x, body_top, line_end_x, body_top)
+                segments.append((line_start_x, body_top, line_end_x, body_top))
         
         # Bottom line: outside body bottom edge
-        if 'bottom_left' in pad_positions and 'bottom_right' in pad_positions:
-            left_pad = pad_positions['bottom_left']
-            right_pad = pad_positions['bottom_right']
-            line_start_x = left_pad.x + left_pad.width/2 + silk_pad_offset
-            line_end_x = right_pad.x - right_pad.width/2 - silk_pad_offset
+        if bottom_left and bottom_right:
+            left_pad = bottom_left
+            right_pad = bottom_right
+            line_start_x = left_pad.x + left_pad.half_width + silk_pad_offset
+            line_end_x = right_pad.x - right_pad.half_width - silk_pad_offset
             if line_end_x > line_start_x:
-                pattern.line(line_start_x, body_bottom, line_end_x, body_bottom)
+                segments.append((line_start_x, body_bottom, line_end_x, body_bottom))
         
         # Draw vertical lines (left and right) - positioned outside body edges like QFP/QFN
         body_left = -w / 2 - lw / 2
         body_right = w / 2 + lw / 2
         
         # Left line: outside body left edge
-        if 'bottom_left' in pad_positions and 'top_left' in pad_positions:
-            bottom_pad = pad_positions['bottom_left']
-            top_pad = pad_positions['top_left']
-            line_start_y = bottom_pad.y + bottom_pad.height/2 + silk_pad_offset
-            line_end_y = top_pad.y - top_pad.height/2 - silk_pad_offset
+        if bottom_left and top_left:
+            bottom_pad = bottom_left
+            top_pad = top_left
+            line_start_y = bottom_pad.y + bottom_pad.half_height + silk_pad_offset
+            line_end_y = top_pad.y - top_pad.half_height - silk_pad_offset
             if line_end_y > line_start_y:
-                pattern.line(body_left, line_start_y, body_left, line_end_y)
+                segments.append((body_left, line_start_y, body_left, line_end_y))
         
         # Right line: outside body right edge
-        if 'bottom_right' in pad_positions and 'top_right' in pad_positions:
-            bottom_pad = pad_positions['bottom_right']
-            top_pad = pad_positions['top_right']
-            line_start_y = bottom_pad.y + bottom_pad.height/2 + silk_pad_offset
-            line_end_y = top_pad.y - top_pad.height/2 - silk_pad_offset
+        if bottom_right and top_right:
+            bottom_pad = bottom_right
+            top_pad = top_right
+            line_start_y = bottom_pad.y + bottom_pad.half_height + silk_pad_offset
+            line_end_y = top_pad.y - top_pad.half_height - silk_pad_offset
             if line_end_y > line_start_y:
-                pattern.line(body_right, line_start_y, body_right, line_end_y)
+                segments.append((body_right, line_start_y, body_right, line_end_y))
+        pattern.lines(segments)
         
         # Add pin 1 dot indicator (1mm away from pad)
-        if housing.get('polarized') and 'top_left' in pad_positions:
-            pad1 = pad_positions['top_left']  # Pin 1 is top-left (with [4,1,3,2] ordering)
+        if housing.get('polarized') and top_left:
+            pad1 = top_left  # Pin 1 is top-left (with [4,1,3,2] ordering)
             # Position 1mm away from pad edge
-            dot1_x = pad1.x - pad1.width/2 - 0.5  # 1mm left from pad edge
+            dot1_x = pad1.x - pad1.half_width - 0.5  # 1mm left from pad edge
             dot1_y = pad1.y  # Aligned with pad 1 Y position
-            # Circle with 0.2mm radius, 0.1mm line width, filled
-            pattern.layer('topSilkscreen').lineWidth(0.1).fill(True).circle(dot1_x, dot1_y, 0.2).fill(False)
+            _draw_polarity_dot(pattern, dot1_x, dot1_y)
 
 
 def grid_array(pattern, housing):
@@ -288,11 +318,16 @@ def grid_array(pattern, housing):
     dy = y - housing['verticalPitch'] * (housing['rowCount'] / 2 - 0.5)
     d = min(dx, dy)
     length = min(2 * housing['horizontalPitch'], 2 * housing['verticalPitch'], x, y)
-    p = preamble(pattern, housing)
-    p.moveTo(-x, -y + length).lineTo(-x, -y + d).lineTo(-x + d, -y).lineTo(-x + length, -y)
-    p.moveTo(x, -y + length).lineTo(x, -y).lineTo(x - length, -y)
-    p.moveTo(x, y - length).lineTo(x, y).lineTo(x - length, y)
-    p.moveTo(-x, y - length).lineTo(-x, y).lineTo(-x + length, y)
+    preamble(pattern, housing).lines((
+        # Chamfered pin-1 corner
+        (-x, -y + length, -x, -y + d),
+        (-x, -y + d, -x + d, -y),
+        (-x + d, -y, -x + length, -y),
+        # Remaining corners
+        (x, -y + length, x, -y), (x, -y, x - length, -y),
+        (x, y - length, x, y), (x, y, x - length, y),
+        (-x, y - length, -x, y), (-x, y, -x + length, y),
+    ))
 
 
 def pak(pattern, housing):
@@ -306,26 +341,29 @@ def pak(pattern, housing):
         tab_ledge = tab.get('nom', tab.get('min', tab.get('max', 0)))
     else:
         tab_ledge = tab if tab is not None else 0
-    first_pad, last_pad = list(pattern.pads.values())[0], list(pattern.pads.values())[-1]
+    first_pad, last_pad = next(iter(pattern.pads.values())), next(reversed(pattern.pads.values()))
     gap = lw / 2 + s['clearance']['padToSilk']
     dx = ls / 2 - tab_ledge - bw / 2
     x1 = dx - bw / 2 - lw / 2
     x2 = dx + bw / 2 + lw / 2
     y1 = -bl / 2 - lw / 2
     y2 = -y1
-    xf = first_pad.x - first_pad.width / 2 - gap
-    yf = first_pad.y - first_pad.height / 2 - gap
-    xt = last_pad.x - last_pad.width / 2 - gap
-    yt = last_pad.y - last_pad.height / 2 - gap
+    xf = first_pad.x - first_pad.half_width - gap
+    yf = first_pad.y - first_pad.half_height - gap
+    xt = last_pad.x - last_pad.half_width - gap
+    yt = last_pad.y - last_pad.half_height - gap
     xp = first_pad.x
     yp = (yf if xp < x1 else y1) - 1.5 * lw
     preamble(pattern, housing)
-    pattern.silk_rectangle(x1, y1, x2, y2) if hasattr(pattern, 'silk_rectangle') else pattern.rectangle(x1, y1, x2, y2)
+    pattern.rectangle(x1, y1, x2, y2)
     pattern.circle(xp, yp, 0)
-    pattern.moveTo(x1, yf).lineTo(xf, yf).lineTo(xf, yf + first_pad.height + gap)
+    segments = [(x1, yf, xf, yf), (xf, yf, xf, yf + first_pad.height + gap)]
     if yt < y1:
-        pattern.moveTo(x2, yt).lineTo(xt, yt).lineTo(xt, y1)
-        pattern.moveTo(x2, -yt).lineTo(xt, -yt).lineTo(xt, -y1)
+        segments += [
+            (x2, yt, xt, yt), (xt, yt, xt, y1),
+            (x2, -yt, xt, -yt), (xt, -yt, xt, -y1),
+        ]
+    pattern.lines(segments)
 
 def quad(pattern, housing):
     s = pattern.settings
@@ -340,7 +378,7 @@ def quad(pattern, housing):
     package_type = "QFP" if housing.get('qfp') else ("QFN" if housing.get('qfn') else "CQFP")
     _dbg(f"DEBUG QUAD SILKSCREEN: Package type = {package_type}")
     _dbg(f"DEBUG: Body dimensions = {body_width:.3f} x {body_length:.3f}")
-    _dbg(f"DEBUG: Pad count = {len(list(pattern.pads.values()))}")
+    _dbg(f"DEBUG: Pad count = {len(pattern.pads)}")
     
     # Get all pads to find clearance boundaries
     pads = list(pattern.pads.values())
@@ -432,7 +470,7 @@ def quad(pattern, housing):
             _dbg(f"DEBUG: Processing {group_name} pad {i}: pos=({pad.x:.3f}, {pad.y:.3f})")
             # For horizontal corner lines: find constraint from pads on top/bottom
             # Need the OUTER edge of the pad (farthest from body center)
-            pad_edge_x = abs(pad.x) + pad.width/2  # outer edge distance from center
+            pad_edge_x = pad.extent_x  # outer edge distance from center
             
             _dbg(f"DEBUG: Pad {i} (top/bottom): pos=({pad.x:.3f}, {pad.y:.3f}), size={pad.width:.3f}x{pad.height:.3f}")
             _dbg(f"  pad_edge_x (outer) = {pad_edge_x:.3f}")
@@ -453,7 +491,7 @@ def quad(pattern, housing):
             _dbg(f"DEBUG: Processing {group_name} pad {i}: pos=({pad.x:.3f}, {pad.y:.3f})")
             # For vertical corner lines: find constraint from pads on left/right
             # Need the OUTER edge of the pad (farthest from body center)
-            pad_edge_y = abs(pad.y) + pad.height/2  # outer edge distance from center
+            pad_edge_y = pad.extent_y  # outer edge distance from center
             
             _dbg(f"DEBUG: Pad {i} (left/right): pos=({pad.x:.3f}, {pad.y:.3f}), size={pad.width:.3f}x{pad.height:.3f}")
             _dbg(f"  pad_edge_y (outer) = {pad_edge_y:.3f}")
@@ -500,52 +538,52 @@ def quad(pattern, housing):
     _dbg(f"DEBUG: Line ends at: x={line_end_x:.3f}, y={line_end_y:.3f}")
     _dbg(f"DEBUG: Line edges at: x={line_edge_x:.3f}, y={line_edge_y:.3f}")
     
-    # Find nearest pads to verify clearance
-    nearest_pad_x = None
-    nearest_pad_y = None
-    min_dist_x = float('inf')
-    min_dist_y = float('inf')
+    # Find nearest pads to verify clearance (diagnostics only; nothing below uses it)
+    if _debug_enabled():
+        nearest_pad_x = None
+        nearest_pad_y = None
+        min_dist_x = float('inf')
+        min_dist_y = float('inf')
     
-    for pad in pads:
-        if abs(pad.y) > body_length / 2:  # Top/bottom pad
-            pad_edge = abs(pad.x) - pad.width/2
-            dist = pad_edge - line_edge_x
-            if dist < min_dist_x:
-                min_dist_x = dist
-                nearest_pad_x = pad
-        
-        if abs(pad.x) > body_width / 2:  # Left/right pad
-            pad_edge = abs(pad.y) - pad.height/2
-            dist = pad_edge - line_edge_y
-            if dist < min_dist_y:
-                min_dist_y = dist
-                nearest_pad_y = pad
-    
-    if nearest_pad_x:
-        _dbg(f"DEBUG: Nearest X-constraining pad: pos=({nearest_pad_x.x:.3f}, {nearest_pad_x.y:.3f}), clearance={min_dist_x:.3f}")
-    if nearest_pad_y:
-        _dbg(f"DEBUG: Nearest Y-constraining pad: pos=({nearest_pad_y.x:.3f}, {nearest_pad_y.y:.3f}), clearance={min_dist_y:.3f}")
-    
-    # Top-left corner
-    pattern.line(-body_x, body_y, -body_x + corner_length_x, body_y)   # horizontal (toward right)
-    pattern.line(-body_x, body_y, -body_x, body_y - corner_length_y)   # vertical (toward down)
-    
-    # Top-right corner  
-    pattern.line(body_x, body_y, body_x - corner_length_x, body_y)     # horizontal (toward left)
-    pattern.line(body_x, body_y, body_x, body_y - corner_length_y)     # vertical (toward down)
-    
-    # Bottom-right corner
-    pattern.line(body_x, -body_y, body_x - corner_length_x, -body_y)   # horizontal (toward left)
-    pattern.line(body_x, -body_y, body_x, -body_y + corner_length_y)   # vertical (toward up)
-    
-    # Bottom-left corner
-    pattern.line(-body_x, -body_y, -body_x + corner_length_x, -body_y) # horizontal (toward right)
-    pattern.line(-body_x, -body_y, -body_x, -body_y + corner_length_y) # vertical (toward up)
+        for pad in pads:
+            if abs(pad.y) > body_length / 2:  # Top/bottom pad
+                pad_edge = abs(pad.x) - pad.half_width
+                dist = pad_edge - line_edge_x
+                if dist < min_dist_x:
+                    min_dist_x = dist
+                    nearest_pad_x = pad
+        
+            if abs(pad.x) > body_width / 2:  # Left/right pad
+                pad_edge = abs(pad.y) - pad.half_height
+                dist = pad_edge - line_edge_y
+                if dist < min_dist_y:
+                    min_dist_y = dist
+                    nearest_pad_y = pad
+    
+        if nearest_pad_x:
+            _dbg(f"DEBUG: Nearest X-constraining pad: pos=({nearest_pad_x.x:.3f}, {nearest_pad_x.y:.3f}), clearance={min_dist_x:.3f}")
+        if nearest_pad_y:
+            _dbg(f"DEBUG: Nearest Y-constraining pad: pos=({nearest_pad_y.x:.3f}, {nearest_pad_y.y:.3f}), clearance={min_dist_y:.3f}")
+    
+    pattern.lines((
+        # Top-left corner
+        (-body_x, body_y, -body_x + corner_length_x, body_y),    # horizontal (toward right)
+        (-body_x, body_y, -body_x, body_y - corner_length_y),    # vertical (toward down)
+        # Top-right corner
+        (body_x, body_y, body_x - corner_length_x, body_y),      # horizontal (toward left)
+        (body_x, body_y, body_x, body_y - corner_length_y),      # vertical (toward down)
+        # Bottom-right corner
+        (body_x, -body_y, body_x - corner_length_x, -body_y),    # horizontal (toward left)
+        (body_x, -body_y, body_x, -body_y + corner_length_y),    # vertical (toward up)
+        # Bottom-left corner
+        (-body_x, -body_y, -body_x + corner_length_x, -body_y),  # horizontal (toward right)
+        (-body_x, -body_y, -body_x, -body_y + corner_length_y),  # vertical (toward up)
+    ))
     
     # Add polarity marker if needed
     if housing.get('polarized'):
         # Place dot1 circle above the first pad
-        pad1 = list(pattern.pads.values())[0]
+        pad1 = next(iter(pattern.pads.values()))
         pad1_x = pad1.x
         pad1_y = pad1.y
         pad1_size_y = pad1.height
@@ -554,8 +592,7 @@ def quad(pattern, housing):
         dot1_x = pad1_x - 0.75  # Move 0.75mm to the left
         dot1_y = pad1_y - pad1_size_y/2 - 0.25 - silk_to_pad_clearance
         
-        # Circle with 0.2mm radius, 0.1mm line width, filled
-        pattern.layer('topSilkscreen').lineWidth(0.1).fill(True).circle(dot1_x, dot1_y, 0.2).fill(False)
+        _draw_polarity_dot(pattern, dot1_x, dot1_y)
 
 
 def sodfl_preamble(pattern, housing):
@@ -564,19 +601,16 @@ def sodfl_preamble(pattern, housing):
     
     # Calculate text position using real pad positions (similar to chip)
     if pattern.pads:
-        pad_extent = 0
-        for pad in pattern.pads.values():
-            # Calculate the farthest point of each pad from center
-            # For SODFL (horizontal layout), use Y extent
-            pad_extent = max(pad_extent, abs(pad.y) + pad.height / 2)
+        # Farthest point of any pad from center.
+        # For SODFL (horizontal layout), use Y extent
+        pad_extent = max(pad.extent_y for pad in pattern.pads.values())
         
         if pad_extent == 0:
             pad_extent = 0.7  # fallback if no pads found
         
         # Use SODFL body dimensions for comparison
         body_y = housing['bodyWidth']['nom'] / 2  # For SODFL, body width becomes Y extent
-        courtyard = pattern.settings.get('clearance', {}).get('courtyard', 0.25)
-        text_y = -(max(body_y, pad_extent) + 1.25)
+        text_y = _text_y_for(body_y, pad_extent)
     else:
         text_y = -1.5  # fallback
     
@@ -606,14 +640,8 @@ def sodfl(pattern, housing):
     bl = housing['bodyLength']['nom']  # This becomes X extent
     
     # Since SODFL is rotated like chip: x = bl/2, y = bw/2
-    body_x = bl / 2  # Use body length for X extent
-    body_y = bw / 2  # Use body width for Y extent
-    
     # Body outline coordinates (with line width offset)
-    body_left = -body_x - lw / 2
-    body_right = body_x + lw / 2
-    body_top = body_y + lw / 2
-    body_bottom = -body_y - lw / 2
+    body_left, body_right, body_top, body_bottom = _body_box(bl, bw, lw)
     
     # Get pad information
     pads = list(pattern.pads.values())
@@ -623,9 +651,9 @@ def sodfl(pattern, housing):
         
         # Calculate pad clearance boundaries (0.2mm clearance from pad edges)
         pad_clearance = 0.2  # As requested
-        pad1_right = pad1.x + pad1.width / 2 + pad_clearance
-        pad2_left = pad2.x - pad2.width / 2 - pad_clearance
-        pad_top = max(abs(pad1.y) + pad1.height / 2, abs(pad2.y) + pad2.height / 2) + pad_clearance
+        pad1_right = pad1.x + pad1.half_width + pad_clearance
+        pad2_left = pad2.x - pad2.half_width - pad_clearance
+        pad_top = max(pad1.extent_y, pad2.extent_y) + pad_clearance
         pad_bottom = -pad_top
         
         # Use SODFL-specific preamble for text positioning
@@ -637,25 +665,26 @@ def sodfl(pattern, housing):
         # Top U (encircling top of body) - shaped like ∩ 
         # Vertical lines need to stop before reaching pad clearance + line width/2
         top_vertical_end = pad_top + lw / 2  # Account for line thickness
-        pattern.line(body_left, body_top, body_left, top_vertical_end)   # left vertical
-        pattern.line(body_left, body_top, body_right, body_top)          # top horizontal  
-        pattern.line(body_right, body_top, body_right, top_vertical_end) # right vertical
+        pattern.polyline((
+            (body_left, top_vertical_end), (body_left, body_top),
+            (body_right, body_top), (body_right, top_vertical_end),
+        ))
         
         # Bottom U (encircling bottom of body) - shaped like ∪
         # Vertical lines need to stop before reaching pad clearance + line width/2
         bottom_vertical_end = pad_bottom - lw / 2  # Account for line thickness
-        pattern.line(body_left, body_bottom, body_left, bottom_vertical_end)  # left vertical
-        pattern.line(body_left, body_bottom, body_right, body_bottom)         # bottom horizontal
-        pattern.line(body_right, body_bottom, body_right, bottom_vertical_end) # right vertical
+        pattern.polyline((
+            (body_left, bottom_vertical_end), (body_left, body_bottom),
+            (body_right, body_bottom), (body_right, bottom_vertical_end),
+        ))
         
         # Add larger polarity dot (0.5mm as requested, moved 0.1mm more to the left)
         if housing.get('polarized'):
             # Position relative to left pad (pin 1), moved 0.1mm more to the left
-            dot_x = pad1.x - pad1.width / 2 - silk_pad_clearance - 0.6  # Original offset + 0.1mm more
+            dot_x = pad1.x - pad1.half_width - silk_pad_clearance - 0.6  # Original offset + 0.1mm more
             dot_y = 0  # Centered vertically
             
-            # Draw dot with 0.2mm radius, 0.1mm line width, filled
-            pattern.layer('topSilkscreen').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+            _draw_polarity_dot(pattern, dot_x, dot_y)
     else:
         # Fallback: use SODFL preamble for text positioning
         sodfl_preamble(pattern, housing)
@@ -667,19 +696,16 @@ def molded_preamble(pattern, housing):
     
     # Calculate text position using real pad positions (similar to SODFL)
     if pattern.pads:
-        pad_extent = 0
-        for pad in pattern.pads.values():
-            # Calculate the farthest point of each pad from center
-            # For molded (horizontal layout), use Y extent
-            pad_extent = max(pad_extent, abs(pad.y) + pad.height / 2)
+        # Farthest point of any pad from center.
+        # For molded (horizontal layout), use Y extent
+        pad_extent = max(pad.extent_y for pad in pattern.pads.values())
         
         if pad_extent == 0:
             pad_extent = 0.7  # fallback if no pads found
         
         # Use molded body dimensions for comparison
         body_y = housing['bodyWidth']['nom'] / 2  # For molded, body width becomes Y extent
-        courtyard = pattern.settings.get('clearance', {}).get('courtyard', 0.25)
-        text_y = -(max(body_y, pad_extent) + 1.25)
+        text_y = _text_y_for(body_y, pad_extent)
     else:
         text_y = -1.5  # fallback
     
@@ -709,14 +735,8 @@ def molded(pattern, housing):
     bl = housing['bodyLength']['nom']  # This becomes X extent
     
     # Since molded is rotated like chip: x = bl/2, y = bw/2
-    body_x = bl / 2  # Use body length for X extent
-    body_y = bw / 2  # Use body width for Y extent
-    
     # Body outline coordinates (with line width offset)
-    body_left = -body_x - lw / 2
-    body_right = body_x + lw / 2
-    body_top = body_y + lw / 2
-    body_bottom = -body_y - lw / 2
+    body_left, body_right, body_top, body_bottom = _body_box(bl, bw, lw)
     
     # Get pad information
     pads = list(pattern.pads.values())
@@ -726,9 +746,9 @@ def molded(pattern, housing):
         
         # Calculate pad clearance boundaries (0.2mm clearance from pad edges)
         pad_clearance = 0.2  # As requested
-        pad1_right = pad1.x + pad1.width / 2 + pad_clearance
-        pad2_left = pad2.x - pad2.width / 2 - pad_clearance
-        pad_top = max(abs(pad1.y) + pad1.height / 2, abs(pad2.y) + pad2.height / 2) + pad_clearance
+        pad1_right = pad1.x + pad1.half_width + pad_clearance
+        pad2_left = pad2.x - pad2.half_width - pad_clearance
+        pad_top = max(pad1.extent_y, pad2.extent_y) + pad_clearance
         pad_bottom = -pad_top
         
         # Use molded-specific preamble for text positioning
@@ -740,25 +760,26 @@ def molded(pattern, housing):
         # Top U (encircling top of body) - shaped like ∩ 
         # Vertical lines need to stop before reaching pad clearance + line width/2
         top_vertical_end = pad_top + lw / 2  # Account for line thickness
-        pattern.line(body_left, body_top, body_left, top_vertical_end)   # left vertical
-        pattern.line(body_left, body_top, body_right, body_top)          # top horizontal  
-        pattern.line(body_right, body_top, body_right, top_vertical_end) # right vertical
+        pattern.polyline((
+            (body_left, top_vertical_end), (body_left, body_top),
+            (body_right, body_top), (body_right, top_vertical_end),
+        ))
         
         # Bottom U (encircling bottom of body) - shaped like ∪
         # Vertical lines need to stop before reaching pad clearance + line width/2
         bottom_vertical_end = pad_bottom - lw / 2  # Account for line thickness
-        pattern.line(body_left, body_bottom, body_left, bottom_vertical_end)  # left vertical
-        pattern.line(body_left, body_bottom, body_right, body_bottom)         # bottom horizontal
-        pattern.line(body_right, body_bottom, body_right, bottom_vertical_end) # right vertical
+        pattern.polyline((
+            (body_left, bottom_vertical_end), (body_left, body_bottom),
+            (body_right, body_bottom), (body_right, bottom_vertical_end),
+        ))
         
         # Add larger polarity dot (0.5mm as requested, moved 0.1mm more to the left)
         if housing.get('polarized'):
             # Position relative to left pad (pin 1), moved 0.1mm more to the left
-            dot_x = pad1.x - pad1.width / 2 - silk_pad_clearance - 0.6  # Original offset + 0.1mm more
+            dot_x = pad1.x - pad1.half_width - silk_pad_clearance - 0.6  # Original offset + 0.1mm more
             dot_y = 0  # Centered vertically
             
-            # Draw dot with 0.2mm radius, 0.1mm line width, filled
-            pattern.layer('topSilkscreen').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+            _draw_polarity_dot(pattern, dot_x, dot_y)
     else:
         # Fallback: use molded preamble for text positioning
         molded_preamble(pattern, housing)
@@ -774,20 +795,15 @@ def dfn_molded_style(pattern, housing):
     # Body dimensions (DFN horizontal layout similar to molded: x = bl/2, y = bw/2)
     bw = housing['bodyWidth']['nom']
     bl = housing['bodyLength']['nom']
-    body_x = bl / 2
-    body_y = bw / 2
 
     # Body outline coordinates (with line width offset)
-    body_left = -body_x - lw / 2
-    body_right = body_x + lw / 2
-    body_top = body_y + lw / 2
-    body_bottom = -body_y - lw / 2
+    body_left, body_right, body_top, body_bottom = _body_box(bl, bw, lw)
 
     # Determine vertical endpoints from pad extents across all pads
     pads = list(pattern.pads.values())
     if pads:
         pad_clearance = 0.2
-        pad_top = max(abs(p.y) + p.height / 2 for p in pads) + pad_clearance
+        pad_top = max(p.extent_y for p in pads) + pad_clearance
         pad_bottom = -pad_top
 
         # Use molded preamble for text positioning (same rotation/placement)
@@ -795,23 +811,25 @@ def dfn_molded_style(pattern, housing):
 
         # Top U (∩)
         top_vertical_end = pad_top + lw / 2
-        pattern.line(body_left, body_top, body_left, top_vertical_end)
-        pattern.line(body_left, body_top, body_right, body_top)
-        pattern.line(body_right, body_top, body_right, top_vertical_end)
+        pattern.polyline((
+            (body_left, top_vertical_end), (body_left, body_top),
+            (body_right, body_top), (body_right, top_vertical_end),
+        ))
 
         # Bottom U (∪)
         bottom_vertical_end = pad_bottom - lw / 2
-        pattern.line(body_left, body_bottom, body_left, bottom_vertical_end)
-        pattern.line(body_left, body_bottom, body_right, body_bottom)
-        pattern.line(body_right, body_bottom, body_right, bottom_vertical_end)
+        pattern.polyline((
+            (body_left, bottom_vertical_end), (body_left, body_bottom),
+            (body_right, body_bottom), (body_right, bottom_vertical_end),
+        ))
 
         # Polarity dot near the leftmost pad if polarized
         if housing.get('polarized'):
-            leftmost = min(pads, key=lambda p: p.x)
+            leftmost = min(pads, key=attrgetter('x'))
             # Place dot center 0.6mm from pad edge toward left (closer than previous 0.8mm)
-            dot_x = leftmost.x - leftmost.width / 2 - 0.6
+            dot_x = leftmost.x - leftmost.half_width - 0.6
             dot_y = 0
-            pattern.layer('topSilkscreen').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+            _draw_polarity_dot(pattern, dot_x, dot_y)
     else:
         # Fallback
         molded_preamble(pattern, housing)
@@ -829,7 +847,9 @@ def two_pin(pattern, housing):
     
     s = pattern.settings
     lw = s['lineWidth']['silkscreen']
-    first_pad = list(pattern.pads.values())[0]
+    silk_pad_clearance = s['clearance']['silkToPad']
+    silk_pad_offset = silk_pad_clearance + lw / 2
+    first_pad = next(iter(pattern.pads.values()))
     gap = lw / 2 + s['clearance']['padToSilk']
     
     if 'bodyWidth' in housing and 'bodyLength' in housing:
@@ -839,17 +859,13 @@ def two_pin(pattern, housing):
         if housing.get('chip'):
             # For chip: KiCad-style horizontal lines between the pads (in the center gap)
             # Calculate silk line positions avoiding pads
-            silk_pad_clearance = s['clearance']['silkToPad']
-            silk_line_width = s['lineWidth']['silkscreen']
-            silk_pad_offset = silk_pad_clearance + silk_line_width / 2
-            
             # Calculate line position - between the pads horizontally
             # Pad 1 is at negative x, pad 2 is at positive x
             # We want lines in the center gap between them
             
             # Get the gap between pads
-            pad1_right_edge = first_pad.x + first_pad.width / 2  # right edge of left pad
-            pad2_left_edge = -first_pad.x - first_pad.width / 2  # left edge of right pad (symmetric)
+            pad1_right_edge = first_pad.x + first_pad.half_width  # right edge of left pad
+            pad2_left_edge = -first_pad.x - first_pad.half_width  # left edge of right pad (symmetric)
             
             # Line starts after pad1 + clearance, ends before pad2 - clearance
             line_start_x = pad1_right_edge + silk_pad_offset
@@ -872,24 +888,20 @@ def two_pin(pattern, housing):
                 
                 if housing.get('polarized'):
                     # Polarity mark near pad 1 (left side)
-                    mark_x = first_pad.x - first_pad.width / 2 - silk_pad_offset - 0.1
+                    mark_x = first_pad.x - first_pad.half_width - silk_pad_offset - 0.1
                     pattern.circle(mark_x, 0, 0.05)
             else:
                 # Lines too short, just add the preamble for refDes positioning
                 chip_preamble(pattern, housing)
         else:
             # Standard two-pin orientation
-            x1 = first_pad.width / 2 + gap
+            x1 = first_pad.half_width + gap
             x2 = w / 2 + lw / 2
             x = max(x1, x2)
             y = l / 2 + lw / 2
             preamble(pattern, housing)
             if housing.get('cae') and not housing.get('nosilk'):
                 # CAE silkscreen: split into top and bottom patterns, avoiding pads
-                s = pattern.settings
-                lw = s['lineWidth']['silkscreen']
-                silk_pad_clearance = s['clearance']['silkToPad']
-                
                 bw = housing['bodyWidth']['nom']
                 bl = housing['bodyLength']['nom']
                 
@@ -909,31 +921,37 @@ def two_pin(pattern, housing):
                 d_silk = d + 0.06  # Also add to chamfer
                 
                 # Get pad positions to avoid them
-                pads = list(pattern.pads.values())
-                pad1 = pads[0]  # Left pad
-                pad2 = pads[1]  # Right pad
+                pads = iter(pattern.pads.values())
+                pad1 = next(pads)  # Left pad
+                pad2 = next(pads)  # Right pad
                 
                 # Calculate pad boundaries with clearance (including silkscreen line width)
                 pad_clearance = silk_pad_clearance + lw / 2  # Total clearance including line width
-                pad1_bottom = pad1.y + pad1.height / 2 + pad_clearance
-                pad1_top = pad1.y - pad1.height / 2 - pad_clearance
-                pad2_bottom = pad2.y + pad2.height / 2 + pad_clearance
-                pad2_top = pad2.y - pad2.height / 2 - pad_clearance
+                pad1_bottom = pad1.y + pad1.half_height + pad_clearance
+                pad1_top = pad1.y - pad1.half_height - pad_clearance
+                pad2_bottom = pad2.y + pad2.half_height + pad_clearance
+                pad2_top = pad2.y - pad2.half_height - pad_clearance
                 
                 # Top pattern: chamfered top with vertical lines avoiding pads
                 # Top horizontal line with chamfer
-                pattern.moveTo(-x_silk, pad1_top).lineTo(-x_silk, -y_silk + d_silk).lineTo(-x_silk + d_silk, -y_silk).lineTo(x_silk, -y_silk).lineTo(x_silk, pad2_top)
+                pattern.polyline((
+                    (-x_silk, pad1_top), (-x_silk, -y_silk + d_silk), (-x_silk + d_silk, -y_silk),
+                    (x_silk, -y_silk), (x_silk, pad2_top),
+                ))
                 
                 
                 # Bottom pattern: chamfered bottom with vertical lines avoiding pads
                 # Bottom horizontal line with chamfer
-                pattern.moveTo(-x_silk, pad1_bottom).lineTo(-x_silk, y_silk - d_silk).lineTo(-x_silk + d_silk, y_silk).lineTo(x_silk, y_silk).lineTo(x_silk, pad2_bottom)
+                pattern.polyline((
+                    (-x_silk, pad1_bottom), (-x_silk, y_silk - d_silk), (-x_silk + d_silk, y_silk),
+                    (x_silk, y_silk), (x_silk, pad2_bottom),
+                ))
                 
                 # Add pin 1 indicator dot to the left of pin1
                 if housing.get('polarized'):
-                    dot_x = pad1.x - pad1.width / 2 - 0.4 - 0.1  # 0.2mm clearance + 0.1mm spacing
+                    dot_x = pad1.x - pad1.half_width - 0.4 - 0.1  # 0.2mm clearance + 0.1mm spacing
                     dot_y = pad1.y
-                    pattern.layer('topSilkscreen').lineWidth(0.1).fill(True).circle(dot_x, dot_y, 0.2).fill(False)
+                    _draw_polarity_dot(pattern, dot_x, dot_y)
             elif not housing.get('nosilk'):
                 pattern.line(-x, -y, -x, y).line(x, -y, x, y)
                 if x1 < x2:  # Molded
@@ -944,7 +962,7 @@ def two_pin(pattern, housing):
         if not housing.get('nosilk'):
             pattern.circle(0, 0, r)
         if housing.get('polarized'):
-            y = first_pad.y + first_pad.height / 2 + gap
-            pattern.rectangle(-first_pad.width / 2 - gap, -r, first_pad.width / 2 + gap, y)
+            y = first_pad.y + first_pad.half_height + gap
+            pattern.rectangle(-first_pad.half_width - gap, -r, first_pad.half_width + gap, y)
             pattern.circle(0, -r - 1.5 * lw, 0)
 
@@ -1,4 +1,5 @@
 from ..common import grid_array as grid_array_mod
+from ..common import DENSITY_NAMES, _needs_description
 
 
 def build(pattern, element):
@@ -6,7 +7,7 @@ def build(pattern, element):
     housing['bga'] = True
     
     # Generate description and tags for BGA
-    if not hasattr(pattern, 'description'):
+    if _needs_description(pattern):
         pin_count = housing.get('pinCount', len(element.get('pins', {})))
         pitch = housing.get('pitch', 1.0)
         bl = housing.get('bodyLength', {}).get('nom', 0)
@@ -14,11 +15,7 @@ def build(pattern, element):
         h = housing.get('height', {}).get('max', 0)
         ball_dia = housing.get('ballDiameter', {}).get('nom', 0)
         
-        density_desc = {
-            'L': 'Least',
-            'N': 'Nominal', 
-            'M': 'Most'
-        }.get(pattern.settings.get('densityLevel', 'N'), 'Nominal')
+        density_desc = DENSITY_NAMES.get(pattern.settings.get('densityLevel', 'N'), 'Nominal')
         
         pattern.description = (f"Ball Grid Array (BGA), {pin_count} Pin "
                              f"({pitch:.2f}mm pitch), Body {bl:.2f}mm x {bw:.2f}mm x {h:.2f}mm, "
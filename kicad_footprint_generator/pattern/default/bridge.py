@@ -1,6 +1,9 @@
+from ..common import _needs_name
+
+
 def build(pattern, element):
     housing = element['housing']
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         pattern.name = element['name'].upper()
     pad = {
         'type': 'smd',
@@ -1,19 +1,18 @@
 from ..common import two_pin as tp
+from ..common import _needs_name
+from ..common.dims import hundredths
+from ..common.silkscreen import _dbg, _debug_enabled
+from functools import lru_cache
 import math
 
 
-def _generate_description_and_tags(housing, density_level):
+_DENSITY_TEXT = {'L': 'Least Density', 'N': 'Nominal Density', 'M': 'Most Density'}
+
+
+@lru_cache(maxsize=2048)
+def _description_and_tags(bl, bw, h, ll, density_level):
     """Generate description and tags for CAE components"""
-    
-    # Get dimensions
-    bl = housing['bodyLength']['nom'] 
-    bw = housing['bodyWidth']['nom']
-    h = housing.get('height', {}).get('max', 0)
-    ll = housing.get('leadLength', {}).get('nom', 0)
-    
-    # Map density level to text
-    density_map = {'L': 'Least Density', 'N': 'Nominal Density', 'M': 'Most Density'}
-    density_text = density_map.get(density_level, 'Nominal Density')
+    density_text = _DENSITY_TEXT.get(density_level, 'Nominal Density')
     
     # Generate description in the specified format
     descr = f"Aluminium Electrolytic Capacitor, Length {bl:.2f}mm, Width {bw:.2f}mm, Height {h:.2f}mm, Lead Length {ll:.2f}mm, {density_text}"
@@ -32,22 +31,18 @@ def build(pattern, element):
     span = housing.get('leadSpan')
     if ll and ls:
         # Expect min/nom/max; compute tol as RMS of tolerances
-        ll_min, ll_nom, ll_max = ll.get('min'), ll.get('nom'), ll.get('max')
+        ll_t = (ll.get('min'), ll.get('nom'), ll.get('max'))
         ls_nom = ls.get('nom')
         
         # Handle case where leadSpace only has nominal value
-        if ls_nom is not None and None not in (ll_min, ll_nom, ll_max):
-            # Use leadSpace nominal for all min/nom/max if not provided
-            ls_min = ls.get('min', ls_nom)
-            ls_max = ls.get('max', ls_nom)
-            
-            tol = math.sqrt((ll_max - ll_min) ** 2 + (ls_max - ls_min) ** 2)
-            nom = 2 * ll_nom + ls_nom
-            housing['leadSpan'] = {'min': 2 * ll_min + ls_min, 'nom': nom, 'max': 2 * ll_max + ls_max, 'tol': tol}
-            print(f"=== CAE LEAD SPAN CALCULATION ===")
-            print(f"leadLength: {ll}")
-            print(f"leadSpace: {ls}")
-            print(f"calculated leadSpan: {housing['leadSpan']}")
+        if ls_nom is not None and None not in ll_t:
+            # Use leadSpace nominal for min/max if not provided
+            ls_t = (ls.get('min', ls_nom), ls_nom, ls.get('max', ls_nom))
+            span_min, span_nom, span_max = (2 * l + s for l, s in zip(ll_t, ls_t))
+            tol = math.hypot(ll_t[2] - ll_t[0], ls_t[2] - ls_t[0])
+            housing['leadSpan'] = {'min': span_min, 'nom': span_nom, 'max': span_max, 'tol': tol}
+            if _debug_enabled():
+                _dbg(f"DEBUG CAE lead span: leadLength={ll} leadSpace={ls} -> leadSpan={housing['leadSpan']}")
     elif span and ls and ('min' in span and 'nom' in span and 'max' in span):
         # Derive leadLength from span and space
         ll_min = (span['min'] - ls.get('max', ls.get('nom', 0))) / 2
@@ -56,15 +51,20 @@ def build(pattern, element):
         housing.setdefault('leadLength', {'min': ll_min, 'nom': ll_nom, 'max': ll_max, 'tol': ll_max - ll_min})
     housing['cae'] = True
     # Naming per convention: CAPAE + Base Body Size X Height + L + Lead Length X Width
-    if not getattr(pattern, 'name', None):
-        bw = int(round(housing['bodyWidth']['nom'] * 100))
-        h = int(round(housing['height']['max'] * 100))
-        ll = element['housing'].get('leadLength', {}).get('nom', element['housing'].get('leadLength', {}).get('max', element['housing'].get('leadLength', {}).get('min', 0)))
-        lw = element['housing'].get('leadWidth', {}).get('nom', element['housing'].get('leadWidth', {}).get('max', element['housing'].get('leadWidth', {}).get('min', 0)))
-        pattern.name = f"CAPAE{bw:03d}X{h:03d}L{int(round(ll*100)):03d}X{int(round(lw*100)):03d}{pattern.settings['densityLevel']}"
+    if _needs_name(pattern):
+        density_level = pattern.settings['densityLevel']
+        bw_nom = housing['bodyWidth']['nom']
+        h_max = housing['height']['max']
+        ll_d = housing.get('leadLength') or {}
+        lw_d = housing.get('leadWidth') or {}
+        ll = ll_d.get('nom', ll_d.get('max', ll_d.get('min', 0)))
+        lw = lw_d.get('nom', lw_d.get('max', lw_d.get('min', 0)))
+        pattern.name = f"CAPAE{hundredths(bw_nom):03d}X{hundredths(h_max):03d}L{hundredths(ll):03d}X{hundredths(lw):03d}{density_level}"
         
-        # Generate description and tags
-        descr, tags = _generate_description_and_tags(housing, pattern.settings['densityLevel'])
+        # Generate description and tags (description uses the strict nominal lead length)
+        descr, tags = _description_and_tags(
+            housing['bodyLength']['nom'], bw_nom, h_max, ll_d.get('nom', 0), density_level,
+        )
         pattern.description = descr
         pattern.tags = tags
         
@@ -1,51 +1,45 @@
+from functools import lru_cache
+
 from ..common import two_pin as tp
+from ..common import DENSITY_NAMES, _needs_name
+from ..common.dims import hundredths
+
+
+# Component type to (description, tag)
+_TYPE_MAP = {
+    'CAPC': ('Capacitor', 'capacitor'),
+    'RESC': ('Resistor', 'resistor'),
+    'LEDC': ('LED', 'led'),
+    'DIOC': ('Diode', 'diode'),
+    'BEADC': ('Ferrite Bead', 'ferrite_bead'),
+    'FUSC': ('Fuse', 'fuse'),
+    'THRMC': ('Thermistor', 'thermistor'),
+    'VARC': ('Varistor', 'varistor'),
+}
+
+
+# Standard chip sizes: (length mm, width mm, imperial code)
+_STANDARD_SIZES = (
+    (0.4, 0.2, '01005'),
+    (0.6, 0.3, '0201'),
+    (1.0, 0.5, '0402'),
+    (1.6, 0.8, '0603'),
+    (2.0, 1.25, '0805'),
+    (3.2, 1.6, '1206'),
+    (3.2, 2.5, '1210'),
+    (4.5, 3.2, '1812'),
+    (5.0, 2.5, '2010'),
+    (6.4, 3.2, '2512'),
+)
 
 
-def _generate_description_and_tags(comp_type, housing, density_level):
+@lru_cache(maxsize=2048)
+def _description_and_tags(comp_type, bl, bw, h, ll, density_level):
     """Generate description and tags for chip components"""
+    comp_desc, tag = _TYPE_MAP.get(comp_type, ('Component', 'component'))
     
-    # Component type to description mapping
-    type_map = {
-        'CAPC': ('Capacitor', 'capacitor'),
-        'RESC': ('Resistor', 'resistor'), 
-        'LEDC': ('LED', 'led'),
-        'DIOC': ('Diode', 'diode'),
-        'BEADC': ('Ferrite Bead', 'ferrite_bead'),
-        'FUSC': ('Fuse', 'fuse'),
-        'THRMC': ('Thermistor', 'thermistor'),
-        'VARC': ('Varistor', 'varistor'),
-    }
-    
-    comp_desc, tag = type_map.get(comp_type, ('Component', 'component'))
-    
-    # Get dimensions
-    bl = housing['bodyLength']['nom']
-    bw = housing['bodyWidth']['nom'] 
-    h = housing.get('height', {}).get('max', 0)
-    ll = housing.get('leadLength', {}).get('nom', 0)
-    
-    # Standard chip size mapping (length x width in mm to imperial size)
-    size_map = {
-        (0.4, 0.2): '01005',
-        (0.6, 0.3): '0201', 
-        (1.0, 0.5): '0402',
-        (1.6, 0.8): '0603',
-        (2.0, 1.25): '0805',
-        (3.2, 1.6): '1206',
-        (3.2, 2.5): '1210',
-        (4.5, 3.2): '1812',
-        (5.0, 2.5): '2010',
-        (6.4, 3.2): '2512',
-    }
-    
-    # Find closest standard size
-    std_size = None
-    min_diff = float('inf')
-    for (std_l, std_w), size in size_map.items():
-        diff = abs(bl - std_l) + abs(bw - std_w)
-        if diff < min_diff:
-            min_diff = diff
-            std_size = size
+    # Closest standard size (first entry wins on ties)
+    std_size = min(_STANDARD_SIZES, key=lambda e: abs(bl - e[0]) + abs(bw - e[1]))[2]
     
     # Convert to imperial (inches * 100 for standard notation)
     bl_imp = int(round(bl / 25.4 * 100))
@@ -56,17 +50,14 @@ def _generate_description_and_tags(comp_type, housing, density_level):
     bl_metric = int(round(bl * 10))
     bw_metric = int(round(bw * 10))
     
-    # Density level description
-    density_desc = {
-        'L': 'Least',
-        'N': 'Nominal', 
-        'M': 'Most'
-    }.get(density_level, 'Nominal')
+    density_desc = DENSITY_NAMES.get(density_level, 'Nominal')
     
     # Generate description
-    descr = f"{comp_desc} {std_size or f'{bl_imp:02d}{bw_imp:02d}'} ({bl_metric:02d}{bw_metric:02d} Metric), "
-    descr += f"Length {bl:.2f}mm, Width {bw:.2f}mm, Height {h:.2f}mm, "
-    descr += f"Lead Length {ll:.2f}mm, {density_desc} Density"
+    descr = (
+        f"{comp_desc} {std_size or f'{bl_imp:02d}{bw_imp:02d}'} ({bl_metric:02d}{bw_metric:02d} Metric), "
+        f"Length {bl:.2f}mm, Width {bw:.2f}mm, Height {h:.2f}mm, "
+        f"Lead Length {ll:.2f}mm, {density_desc} Density"
+    )
     
     return descr, tag
 
@@ -75,19 +66,21 @@ def build(pattern, element):
     housing = element['housing']
     housing['chip'] = True
     # Naming per convention: use component type selector
-    if not getattr(pattern, 'name', None):
-        comp_type = element['housing'].get('componentType', 'CAPC')
-        bl = int(round(housing['bodyLength']['nom'] * 100))
-        bw = int(round(housing['bodyWidth']['nom'] * 100))
-        h = int(round(housing.get('height', {}).get('max', 0) * 100))
+    if _needs_name(pattern):
+        comp_type = housing.get('componentType', 'CAPC')
+        density_level = pattern.settings['densityLevel']
+        # Resolve the dimensions once; naming and description share them
+        bl_nom = housing['bodyLength']['nom']
+        bw_nom = housing['bodyWidth']['nom']
+        h_max = (housing.get('height') or {}).get('max', 0)
         # Use nominal lead length for naming (strictly nom per request)
-        ll = element['housing'].get('leadLength', {}).get('nom', 0)
-        bls = f"{bl:03d}"; bws = f"{bw:03d}"; hs = f"{h:03d}"; lls = f"{int(round(ll*100)):03d}"
+        ll = (housing.get('leadLength') or {}).get('nom', 0)
+        bls = f"{hundredths(bl_nom):03d}"; bws = f"{hundredths(bw_nom):03d}"; hs = f"{hundredths(h_max):03d}"; lls = f"{hundredths(ll):03d}"
         # Chip naming per request: <CAT>{L}X{W}X{H}L{LeadLen}
-        pattern.name = f"{comp_type}{bls}X{bws}X{hs}L{lls}{pattern.settings['densityLevel']}"
+        pattern.name = f"{comp_type}{bls}X{bws}X{hs}L{lls}{density_level}"
         
         # Generate description and tags
-        descr, tags = _generate_description_and_tags(comp_type, housing, pattern.settings['densityLevel'])
+        descr, tags = _description_and_tags(comp_type, bl_nom, bw_nom, h_max, ll, density_level)
         pattern.description = descr
         pattern.tags = tags
         
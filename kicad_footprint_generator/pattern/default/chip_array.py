@@ -1,4 +1,6 @@
 from ..common import assembly, calculator, copper, courtyard, silkscreen
+from ..common import _needs_name
+from ..common.dims import hundredths
 
 
 def build(pattern, element):
@@ -7,16 +9,18 @@ def build(pattern, element):
     housing.setdefault('leadSpan', housing['bodyWidth'])
 
     # Naming per table for arrays (CAV/CAF variants)
-    if not getattr(pattern, 'name', None):
-        comp_type = element['housing'].get('componentType', 'CAPCAV')
+    if _needs_name(pattern):
+        comp_type = housing.get('componentType', 'CAPCAV')
         pins = int(round(housing['leadCount']))
-        pitch_h = int(round(housing['pitch'] * 100))
-        bl = int(round(housing['bodyLength']['nom'] * 100))
-        bw = int(round(housing['bodyWidth']['nom'] * 100))
-        bh = int(round(housing['height']['max'] * 100))
-        ll = housing.get('leadLength', {}).get('nom', housing.get('leadLength', {}).get('max', housing.get('leadLength', {}).get('min', 0)))
-        lw = housing.get('leadWidth', {}).get('nom', housing.get('leadWidth', {}).get('max', housing.get('leadWidth', {}).get('min', 0)))
-        pattern.name = f"{comp_type}{pins}P{pitch_h}_{bl:03d}X{bw:03d}X{bh:03d}{int(round(ll*100)):03d}X{int(round(lw*100)):03d}{settings['densityLevel']}"
+        pitch_h = hundredths(housing['pitch'])
+        bl = hundredths(housing['bodyLength']['nom'])
+        bw = hundredths(housing['bodyWidth']['nom'])
+        bh = hundredths(housing['height']['max'])
+        ll_d = housing.get('leadLength') or {}
+        lw_d = housing.get('leadWidth') or {}
+        ll = ll_d.get('nom', ll_d.get('max', ll_d.get('min', 0)))
+        lw = lw_d.get('nom', lw_d.get('max', lw_d.get('min', 0)))
+        pattern.name = f"{comp_type}{pins}P{pitch_h}_{bl:03d}X{bw:03d}X{bh:03d}{hundredths(ll):03d}X{hundredths(lw):03d}{settings['densityLevel']}"
 
     pad_params = calculator.chip_array(pattern.__dict__, housing)
     pad_params['order'] = 'round'
@@ -25,7 +29,7 @@ def build(pattern, element):
         'shape': 'rectangle',
         'width': pad_params['width'],
         'height': pad_params['height'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
+        'layer': copper.LAYERS_SMD_TOP,
     }
 
     copper.dual(pattern, element, pad_params)
@@ -1,33 +1,94 @@
+import re
+from dataclasses import dataclass
+from itertools import chain
+
 from ..common import assembly, calculator, copper, courtyard, silkscreen
 
 
-_pin_number = 0
-_mounting_hole = 1
-_nc_pad = 1
+# Keys that define or place an extra, numerically suffixed pad group
+_PAD_GROUP_KEY = re.compile(r'^(?:padPosition|rowCount|slotWidth|holeDiameter|padDiameter|padWidth)(\d+)$')
+
+
+_TH_LAYERS = ('topCopper', 'topMask', 'intCopper', 'bottomCopper', 'bottomMask')
+
+
+@dataclass
+class _Counters:
+    """Pad numbering state shared by the pad groups of one footprint."""
+    pin_number: int = 0
+    mounting_hole: int = 1
+    nc_pad: int = 1
+
+
+def _expand_number_part(part):
+    if '-' in part:
+        a, b = part.split('-')
+        return map(str, range(int(a), int(b) + 1))
+    return (part,)
 
 
 def _parse_numbers(element, housing, suffix):
     key = f"numbers{suffix}"
-    if key in housing and housing[key]:
-        # Format in Coffee accepts strings like "1-4,6,8"; our GUI/CLI can pass list already
-        if isinstance(housing[key], str):
-            parts = housing[key].replace(' ', '').split(',')
-            out = []
-            for p in parts:
-                if '-' in p:
-                    a, b = p.split('-')
-                    out.extend([str(i) for i in range(int(a), int(b) + 1)])
-                else:
-                    out.append(p)
-            housing[key] = out
-        return housing[key]
+    numbers = housing.get(key)
+    if numbers:
+        # Format in Coffee accepts strings like "1-4,6,8"; our GUI/CLI can pass list already.
+        # The expanded list is stored back so later passes skip the parse.
+        if isinstance(numbers, str):
+            numbers = housing[key] = list(chain.from_iterable(
+                map(_expand_number_part, numbers.replace(' ', '').split(','))
+            ))
+        return numbers
     return list(element['pins'].keys())
 
 
-def _copper_pads(pattern, element, suffix=''):
-    global _pin_number, _mounting_hole, _nc_pad
+def _grid_positions(housing, suffix):
+    """Yield (x, y) for a rowCount x columnCount pad grid centred on the origin, row by row."""
+    row_count = housing[f'rowCount{suffix}']
+    v_pitch = 0 if row_count == 1 else housing.get(f'verticalPitch{suffix}', housing.get(f'pitch{suffix}'))
+    column_count = housing.get(f'columnCount{suffix}', [])
+    column_counts = [column_count] if isinstance(column_count, (int, float)) else column_count
+    h_pitch = housing.get(f'horizontalPitch{suffix}', housing.get(f'pitch{suffix}'))
+
+    def column_xs(column_count):
+        # Identical for every row with the same column count
+        xs = []
+        x = -h_pitch * (column_count - 1) / 2
+        for _ in range(0, column_count):
+            xs.append(x)
+            x += h_pitch
+        return xs
+
+    xs_by_count = {}
+    y = -v_pitch * (row_count - 1) / 2
+    for row in range(0, row_count):
+        column_count = column_counts[row] if row < len(column_counts) and column_counts[row] is not None else column_counts[0]
+        xs = xs_by_count.get(column_count)
+        if xs is None:
+            xs = xs_by_count[column_count] = column_xs(column_count)
+        for x in xs:
+            yield x, y
+        y += v_pitch
+
+
+def _through_hole_pad(width, height, shape, pin_in_paste, pad_bottom, **hole):
+    """Plated pad dict; `hole` carries either hole= or slotWidth=/slotHeight=."""
+    layers = list(_TH_LAYERS)
+    if pin_in_paste:
+        layers.append('bottomPaste' if pad_bottom else 'topPaste')
+    return {'type': 'through-hole', **hole, 'width': width, 'height': height, 'shape': shape, 'layer': layers}
+
+
+def _make_mounting_hole(pad, width, height, pad_shape):
+    # Copper smaller than the drill: emit an unplated hole of the drill size instead
+    pad['type'] = 'mounting-hole'
+    pad['layer'] = ['topMask', 'bottomMask']
+    pad['width'] = width
+    pad['height'] = height
+    pad['shape'] = pad_shape or 'circle'
+
+
+def _copper_pads(pattern, element, counters, suffix=''):
     housing = element['housing']
-    pins = element['pins']
     pin_number_group = 0
     numbers = _parse_numbers(element, housing, suffix)
     has_pads = False
@@ -38,6 +99,12 @@ def _copper_pads(pattern, element, suffix=''):
     pad_d = housing.get(f'padDiameter{suffix}')
     pad_w = housing.get(f'padWidth{suffix}')
     pad_h = housing.get(f'padHeight{suffix}')
+    pad_shape = housing.get(f'padShape{suffix}')
+    pin_in_paste = housing.get(f'pinInPaste{suffix}')
+    pad_bottom = housing.get(f'padBottom{suffix}')
+
+    # Pin 1 of a polarized part gets a rectangular pad unless a shape is given
+    first_shape = pad_shape or ('rectangle' if (counters.pin_number == 0 and housing.get('polarized')) else 'circle')
 
     pad = None
     if slot_w is not None and slot_h is not None:
@@ -50,57 +117,24 @@ def _copper_pads(pattern, element, suffix=''):
             pad_width = pad_w if pad_w is not None else calculator.pad_diameter(pattern.__dict__, housing, slot_w)
             pad_height = pad_h if pad_h is not None else slot_h + (pad_width - slot_w)
             pad_diam = pad_d if pad_d is not None else hole_diam + (pad_width - slot_w)
-        pad = {
-            'type': 'through-hole',
-            'slotWidth': slot_w,
-            'slotHeight': slot_h,
-            'width': pad_width,
-            'height': pad_height,
-            'shape': housing.get(f'padShape{suffix}') or ('rectangle' if (_pin_number == 0 and housing.get('polarized')) else 'circle'),
-            'layer': ['topCopper', 'topMask', 'intCopper', 'bottomCopper', 'bottomMask'],
-        }
-        if housing.get(f'pinInPaste{suffix}'):
-            if housing.get(f'padBottom{suffix}'):
-                pad['layer'].append('bottomPaste')
-            else:
-                pad['layer'].append('topPaste')
+        pad = _through_hole_pad(pad_width, pad_height, first_shape, pin_in_paste, pad_bottom, slotWidth=slot_w, slotHeight=slot_h)
         if (pad_width < slot_w) and (pad_height < slot_h):
-            pad['type'] = 'mounting-hole'
-            pad['layer'] = ['topMask', 'bottomMask']
-            pad['width'] = slot_w
-            pad['height'] = slot_h
-            pad['shape'] = housing.get(f'padShape{suffix}') or 'circle'
+            _make_mounting_hole(pad, slot_w, slot_h, pad_shape)
     elif hole_d is not None:
         pad_diam = pad_d if pad_d is not None else calculator.pad_diameter(pattern.__dict__, housing, hole_d)
         pad_width = pad_w if pad_w is not None else pad_diam
         pad_height = pad_h if pad_h is not None else pad_diam
-        pad = {
-            'type': 'through-hole',
-            'hole': hole_d,
-            'width': pad_width,
-            'height': pad_height,
-            'shape': housing.get(f'padShape{suffix}') or ('rectangle' if (_pin_number == 0 and housing.get('polarized')) else 'circle'),
-            'layer': ['topCopper', 'topMask', 'intCopper', 'bottomCopper', 'bottomMask'],
-        }
-        if housing.get(f'pinInPaste{suffix}'):
-            if housing.get(f'padBottom{suffix}'):
-                pad['layer'].append('bottomPaste')
-            else:
-                pad['layer'].append('topPaste')
+        pad = _through_hole_pad(pad_width, pad_height, first_shape, pin_in_paste, pad_bottom, hole=hole_d)
         if (pad_width < hole_d) or (pad_height < hole_d):
-            pad['type'] = 'mounting-hole'
-            pad['layer'] = ['topMask', 'bottomMask']
-            pad['width'] = hole_d
-            pad['height'] = hole_d
-            pad['shape'] = housing.get(f'padShape{suffix}') or 'circle'
+            _make_mounting_hole(pad, hole_d, hole_d, pad_shape)
     elif (pad_d is not None) or (pad_w is not None and pad_h is not None):
         pad_diam = pad_d
         pad_width = pad_w if pad_w is not None else pad_diam
         pad_height = pad_h if pad_h is not None else pad_diam
         nopaste = housing.get('nopaste') or housing.get(f'noPaste{suffix}')
-        layers = ['bottomCopper', 'bottomMask'] if housing.get(f'padBottom{suffix}') else ['topCopper', 'topMask']
+        layers = ['bottomCopper', 'bottomMask'] if pad_bottom else ['topCopper', 'topMask']
         if not nopaste:
-            layers = layers + (['bottomPaste'] if housing.get(f'padBottom{suffix}') else ['topPaste'])
+            layers = layers + (['bottomPaste'] if pad_bottom else ['topPaste'])
         pad = {
             'type': 'smd',
             'width': pad_width,
@@ -111,88 +145,63 @@ def _copper_pads(pattern, element, suffix=''):
     else:
         return False
 
-    if f'padPosition{suffix}' in housing and housing[f'padPosition{suffix}']:
+    pad_position = housing.get(f'padPosition{suffix}')
+    if pad_position:
+        positions = pattern.parse_points(pad_position)
+    elif f'rowCount{suffix}' in housing and f'columnCount{suffix}' in housing:
+        positions = _grid_positions(housing, suffix)
+    else:
+        positions = None
+
+    if positions is not None:
         has_pads = True
-        points = pattern.parse_position(housing[f'padPosition{suffix}'])
-        for idx, p in enumerate(points):
-            pad['x'] = p['x']
-            pad['y'] = p['y']
-            if pad['type'] == 'mounting-hole':
-                number = f"MH{_mounting_hole}"
-                _mounting_hole += 1
+        is_mounting_hole = pad['type'] == 'mounting-hole'
+        explicit_numbers = f'numbers{suffix}' in housing
+        n_numbers = len(numbers)
+        # Through-hole pads after the first fall back to the plain shape (pin 1 may be rectangular)
+        next_shape = (pad_shape or 'circle') if hole_d is not None else None
+        for x, y in positions:
+            pad['x'] = x
+            pad['y'] = y
+            if is_mounting_hole:
+                number = f"MH{counters.mounting_hole}"
+                counters.mounting_hole += 1
             else:
-                if f'numbers{suffix}' in housing:
+                if explicit_numbers:
                     number = numbers[pin_number_group]
-                    pin_number_group += 1
                 else:
-                    number = numbers[_pin_number + pin_number_group] if (_pin_number + pin_number_group) < len(numbers) else f"NC{_nc_pad}"
+                    idx = counters.pin_number + pin_number_group
+                    number = numbers[idx] if idx < n_numbers else f"NC{counters.nc_pad}"
                     if number.startswith('NC'):
-                        _nc_pad += 1
-                    pin_number_group += 1
+                        counters.nc_pad += 1
+                pin_number_group += 1
+            # pattern.pad() copies the fields into a new shape, so the dict is reused for every pad
             pattern.pad(number, pad)
-            if hole_d is not None:
-                pad['shape'] = housing.get(f'padShape{suffix}') or 'circle'
-    elif f'rowCount{suffix}' in housing and f'columnCount{suffix}' in housing:
-        has_pads = True
-        row_count = housing[f'rowCount{suffix}']
-        v_pitch = 0 if row_count == 1 else housing.get(f'verticalPitch{suffix}', housing.get(f'pitch{suffix}'))
-        row_dxs = pattern.settings.get('parseArray', lambda x: [0])(housing.get(f'rowDX{suffix}')) if False else [0]
-        row_dys = pattern.settings.get('parseArray', lambda x: [0])(housing.get(f'rowDY{suffix}')) if False else [0]
-        column_counts = [housing.get(f'columnCount{suffix}')] if isinstance(housing.get(f'columnCount{suffix}'), (int, float)) else housing.get(f'columnCount{suffix}', [])
-        h_pitch = housing.get(f'horizontalPitch{suffix}', housing.get(f'pitch{suffix}'))
-        column_dxs = [0]
-        column_dys = [0]
-        y = -v_pitch * (row_count - 1) / 2
-        for row in range(0, row_count):
-            column_count = column_counts[row] if row < len(column_counts) and column_counts[row] is not None else column_counts[0]
-            row_dx = row_dxs[row] if row < len(row_dxs) and row_dxs[row] is not None else row_dxs[0]
-            row_dy = row_dys[row] if row < len(row_dys) and row_dys[row] is not None else row_dys[0]
-            x = -h_pitch * (column_count - 1) / 2
-            for column in range(0, column_count):
-                column_dx = column_dxs[column] if column < len(column_dxs) and column_dxs[column] is not None else column_dxs[0]
-                column_dy = column_dys[column] if column < len(column_dys) and column_dys[column] is not None else column_dys[0]
-                pad['x'] = x + row_dx + column_dx
-                pad['y'] = y + row_dy + column_dy
-                if pad['type'] == 'mounting-hole':
-                    number = f"MH{_mounting_hole}"
-                    _mounting_hole += 1
-                else:
-                    if f'numbers{suffix}' in housing:
-                        number = numbers[pin_number_group]
-                        pin_number_group += 1
-                    else:
-                        idx = _pin_number + pin_number_group
-                        number = numbers[idx] if idx < len(numbers) else f"NC{_nc_pad}"
-                        if number.startswith('NC'):
-                            _nc_pad += 1
-                        pin_number_group += 1
-                pattern.pad(number, pad)
-                if hole_d is not None:
-                    pad['shape'] = housing.get(f'padShape{suffix}') or 'circle'
-                x += h_pitch
-            y += v_pitch
-
-    _pin_number += pin_number_group
+            if next_shape is not None:
+                pad['shape'] = next_shape
+                next_shape = None
+
+    counters.pin_number += pin_number_group
     return has_pads
 
 
+def _pad_group_suffixes(housing):
+    """Numeric suffixes of the extra pad groups (padPosition1, holeDiameter2, ...), in order."""
+    return sorted({m.group(1) for m in map(_PAD_GROUP_KEY.match, housing) if m}, key=int)
+
+
 def build(pattern, element):
-    global _pin_number, _mounting_hole, _nc_pad
     housing = element['housing']
     pattern.name = getattr(pattern, 'name', None) or f"{element.get('group','custom')}_{element['name'].upper()}"
     housing.setdefault('bodyPosition', '0, 0')
-    body_pos = pattern.parse_position(housing['bodyPosition'])[0]
+    body_x, body_y = pattern.parse_points(housing['bodyPosition'])[0]
     housing.setdefault('basePoint', '0, 0')
-    base = pattern.parse_position(housing['basePoint'])[0]
-    pattern.center(-body_pos['x'] + base['x'], -body_pos['y'] + base['y'])
-    _pin_number = 0
-    _mounting_hole = 1
-    _nc_pad = 1
-    _copper_pads(pattern, element)
-    i = 1
-    while True:
-        if not _copper_pads(pattern, element, i):
-            break
+    base_x, base_y = pattern.parse_points(housing['basePoint'])[0]
+    pattern.center(-body_x + base_x, -body_y + base_y)
+    counters = _Counters()
+    _copper_pads(pattern, element, counters)
+    for suffix in _pad_group_suffixes(housing):
+        _copper_pads(pattern, element, counters, suffix)
     pattern.center(0, 0)
     copper.mask(pattern)
     silkscreen.body(pattern, housing)
@@ -1,33 +1,36 @@
 
+from functools import lru_cache
+
 from ..common import calculator, courtyard, silkscreen, assembly, copper
+from ..common import DENSITY_NAMES, _needs_name
+from ..common.dims import midpoint_nom, resolve_range
+
 
+# Component type -> (name prefix, description, tag)
+_COMPONENT_MAP = {
+    'capacitor': ('CAPDFN', 'Capacitor, DFN', 'capacitor'),
+    'capacitor_polarized': ('CAPPDFN', 'Capacitor, Polarized, DFN', 'capacitor polarized'),
+    'crystal': ('XTALDFN', 'Crystal, DFN', 'crystal'),
+    'diode': ('DIODFN', 'Diode, DFN', 'diode'),
+    'diode_non_polarized': ('DIONDFN', 'Diode, Non-polarized, DFN', 'diode non-polarized'),
+    'fuse': ('FUSDFN', 'Fuse, DFN', 'fuse'),
+    'inductor': ('INDDFN', 'Inductor, DFN', 'inductor'),
+    'led': ('LEDDFN', 'LED, DFN', 'led'),
+    'resistor': ('RESDFN', 'Resistor, DFN', 'resistor'),
+    'transistor': ('TRXDFN', 'Transistor, DFN', 'transistor')
+}
 
-def _resolve_range(val, prefer='nom'):
-    if isinstance(val, dict):
-        return val.get(prefer, val.get('max', val.get('min', 0)))
-    return float(val or 0)
+# Types whose prefix carries the pin count when there are more than two leads
+_COUNTED_TYPES = frozenset(('diode', 'diode_non_polarized', 'resistor', 'transistor'))
 
 
+@lru_cache(maxsize=None)
 def _get_dfn_component_prefix_and_details(comp_type, lead_count):
     """Get component prefix and description details based on component type"""
-    # Component mapping with prefix, description, and tag
-    component_map = {
-        'capacitor': ('CAPDFN', 'Capacitor, DFN', 'capacitor'),
-        'capacitor_polarized': ('CAPPDFN', 'Capacitor, Polarized, DFN', 'capacitor polarized'),
-        'crystal': ('XTALDFN', 'Crystal, DFN', 'crystal'),
-        'diode': ('DIODFN', 'Diode, DFN', 'diode'),
-        'diode_non_polarized': ('DIONDFN', 'Diode, Non-polarized, DFN', 'diode non-polarized'),
-        'fuse': ('FUSDFN', 'Fuse, DFN', 'fuse'),
-        'inductor': ('INDDFN', 'Inductor, DFN', 'inductor'),
-        'led': ('LEDDFN', 'LED, DFN', 'led'),
-        'resistor': ('RESDFN', 'Resistor, DFN', 'resistor'),
-        'transistor': ('TRXDFN', 'Transistor, DFN', 'transistor')
-    }
-    
-    prefix, description_name, tag = component_map.get(comp_type, ('DIODFN', 'Diode, DFN', 'diode'))
+    prefix, description_name, tag = _COMPONENT_MAP.get(comp_type, ('DIODFN', 'Diode, DFN', 'diode'))
     
     # Add pin count for multi-pin components 
-    if comp_type in ['diode', 'diode_non_polarized', 'resistor', 'transistor'] and lead_count > 2:
+    if comp_type in _COUNTED_TYPES and lead_count > 2:
         prefix += f"{lead_count}"
     
     return prefix, description_name, tag
@@ -41,27 +44,27 @@ def build(pattern, element):
         lead_count = 2
 
     # Name
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         # Get component type from housing
         comp_type = housing.get('componentType', 'diode')
         prefix, description_name, tag = _get_dfn_component_prefix_and_details(comp_type, lead_count)
         
-        # Extract dimensions for naming
-        bl = int(round(housing['bodyLength']['nom'] * 100))
-        bw = int(round(housing['bodyWidth']['nom'] * 100))
-        bh = int(round(housing.get('height', {}).get('max', 0) * 100))
-        ll = housing.get('leadLength', {}).get('nom', (housing.get('leadLength', {}).get('min', 0) + housing.get('leadLength', {}).get('max', 0)) / 2)
-        lw = housing.get('leadWidth', {}).get('nom', (housing.get('leadWidth', {}).get('min', 0) + housing.get('leadWidth', {}).get('max', 0)) / 2)
+        # Extract dimensions once; naming and description share them
+        bl_mm = housing['bodyLength']['nom']
+        bw_mm = housing['bodyWidth']['nom']
+        bh_mm = housing.get('height', {}).get('max', 0)
+        bl = int(round(bl_mm * 100))
+        bw = int(round(bw_mm * 100))
+        bh = int(round(bh_mm * 100))
+        ll = midpoint_nom(housing.get('leadLength'))
+        lw = midpoint_nom(housing.get('leadWidth'))
         
         # DFN component naming: PREFIX + BodyLength X BodyWidth X Height + L LeadLength X LeadWidth  
         pattern.name = f"{prefix}{bl:03d}X{bw:03d}X{bh:03d}L{int(round(ll*100)):03d}X{int(round(lw*100)):03d}{settings['densityLevel']}"
         
         # Generate description and tags
-        density_desc = {'L': 'Least', 'N': 'Nominal', 'M': 'Most'}[settings['densityLevel']]
+        density_desc = DENSITY_NAMES[settings['densityLevel']]
         
-        bl_mm = housing['bodyLength']['nom']
-        bw_mm = housing['bodyWidth']['nom']
-        bh_mm = housing.get('height', {}).get('max', 0)
         ll_mm = ll
         lw_mm = lw
         
@@ -119,8 +122,8 @@ def build(pattern, element):
         pads.append({'name': '2', 'x': x_left, 'y': y_offset, 'w': small_w, 'h': small_h})
         
         # Large pad (pad 3) on the right side
-        tab_w = _resolve_range(housing.get('largePadWidth', {'nom': 1.2}))  # Default 1.2mm if not specified
-        tab_l = _resolve_range(housing.get('largePadLength', {'nom': 1.8}))  # Default 1.8mm if not specified
+        tab_w = resolve_range(housing.get('largePadWidth', {'nom': 1.2}))  # Default 1.2mm if not specified
+        tab_l = resolve_range(housing.get('largePadLength', {'nom': 1.8}))  # Default 1.8mm if not specified
         pads.append({'name': '3', 'x': x_right, 'y': 0.0, 'w': tab_l, 'h': tab_w})
         
     elif lead_count == 4:
@@ -150,7 +153,7 @@ def build(pattern, element):
             'y': p['y'],
             'width': p['w'],
             'height': p['h'],
-            'layer': ['topCopper', 'topMask', 'topPaste'],
+            'layer': copper.LAYERS_SMD_TOP,
         }
         name = p.get('name') or str(pin_num)
         pattern.pad(name, pad)
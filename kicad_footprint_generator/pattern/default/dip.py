@@ -1,4 +1,9 @@
 from ..common import assembly, calculator, copper, courtyard, silkscreen
+from ..common import _needs_name
+
+
+# Courtyard excess per density level
+_COURTYARD = {'M': 1.5, 'N': 0.8, 'L': 0.2}
 
 
 def build(pattern, element):
@@ -13,7 +18,7 @@ def build(pattern, element):
         if str(i) in element['pins']:
             lead_count += 1
 
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         c = 'C' if housing.get('ceramic') else ''
         s = 'S' if housing.get('socket') else ''
         pattern.name = (
@@ -37,7 +42,7 @@ def build(pattern, element):
     }
     copper.dual(pattern, element, pad_params)
     # first pad rectangular
-    first_key = sorted(pattern.pads.keys(), key=lambda k: int(k) if k.isdigit() else k)[0]
+    first_key = min(pattern.pads, key=lambda k: (0, int(k), '') if k.isdigit() else (1, 0, k))
     pattern.pads[first_key].shape = 'rect'
 
     # For DIP, body outline may be absent; approximate body dims for silkscreen/assembly
@@ -48,6 +53,6 @@ def build(pattern, element):
         housing['bodyLength'] = {'nom': housing.get('bodyLength', {}).get('nom', 0)}
     silkscreen.dual(pattern, housing)
     assembly.polarized(pattern, housing)
-    cy = {'M': 1.5, 'N': 0.8, 'L': 0.2}[settings['densityLevel']]
+    cy = _COURTYARD[settings['densityLevel']]
     courtyard.dual(pattern, housing, cy)
 
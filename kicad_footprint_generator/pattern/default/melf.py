@@ -1,10 +1,11 @@
 from ..common import two_pin as tp
+from ..common import _needs_name
 
 
 def build(pattern, element):
     housing = element['housing']
     housing['melf'] = True
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         bl = int(round(housing['bodyLength']['nom'] * 100))
         bd = int(round(housing.get('bodyDiameter', {}).get('nom', housing.get('bodyDiameter', 0)) * 100))
         ll = housing.get('leadLength', {}).get('nom', housing.get('leadLength', {}).get('max', housing.get('leadLength', {}).get('min', 0)))
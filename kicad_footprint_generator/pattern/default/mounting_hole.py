@@ -1,10 +1,28 @@
+import math
+from functools import lru_cache
+
 from ..common import copper, courtyard
+from ..common import _needs_name
+
+
+# Default keepout per density level
+_KEEPOUT = {'M': 0.5, 'N': 0.25, 'L': 0.12}
+
+
+@lru_cache(maxsize=64)
+def _via_directions(count):
+    """(cos, sin) of `count` evenly spaced angles, starting at 0."""
+    directions = []
+    for i in range(0, count):
+        angle = i * 2 * math.pi / count
+        directions.append((math.cos(angle), math.sin(angle)))
+    return tuple(directions)
 
 
 def build(pattern, element):
     housing = element['housing']
     settings = pattern.settings
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         pattern.name = element['name'].upper()
 
     pad = {
@@ -47,14 +65,12 @@ def build(pattern, element):
         }
         count = housing.get('viaCount', 8)
         r = housing['holeDiameter'] / 2 + (d - housing['holeDiameter']) / 4
-        import math
-        for i in range(0, count):
-            angle = i * 2 * math.pi / count
-            via_pad['x'] = r * math.cos(angle)
-            via_pad['y'] = r * math.sin(angle)
+        for cos_a, sin_a in _via_directions(count):
+            via_pad['x'] = r * cos_a
+            via_pad['y'] = r * sin_a
             pattern.pad(1, via_pad)
 
-    housing.setdefault('keepout', {'M': 0.5, 'N': 0.25, 'L': 0.12}[settings['densityLevel']])
+    housing.setdefault('keepout', _KEEPOUT[settings['densityLevel']])
     housing.setdefault('bodyWidth', housing.get('bodyDiameter'))
     csize = {
         'radius': (housing.get('bodyWidth', {}).get('max', pad['width'])) / 2,
@@ -1,4 +1,7 @@
-from ..common import assembly, calculator, copper, courtyard
+from ..common import assembly, calculator, copper, courtyard, silkscreen
+from ..common import DENSITY_NAMES, _needs_name
+from ..common.dims import HousingDims, hundredths, resolve_range
+from ..common.silkscreen import _dbg, _debug_enabled
 from .chip_array import build as chip_array_build
 
 
@@ -17,61 +20,48 @@ def build(pattern, element):
     elif housing.get('side-flat'):
         abbr += 'SF'
 
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         if not housing.get('corner-concave'):
             # Non-corner-concave naming (corner-concave will be handled after calculation)
-            pitch_h = int(round(housing['pitch'] * 100))
-            bl = int(round(housing['bodyLength']['nom'] * 100))
-            bw = int(round(housing['bodyWidth']['nom'] * 100))
-            bh = int(round(housing['height']['max'] * 100))
-            ll = housing.get('leadLength', {}).get('nom', housing.get('leadLength', {}).get('max', housing.get('leadLength', {}).get('min', 0)))
-            lw = housing.get('leadWidth', {}).get('nom', housing.get('leadWidth', {}).get('max', housing.get('leadWidth', {}).get('min', 0)))
+            pitch_h = hundredths(housing['pitch'])
+            d = HousingDims.extract(housing, lead=resolve_range)
             if housing.get('side-concave'):
                 # OSCSC + Pin Qty + P Pitch _ Body L X W X H + Lead L X W
-                pattern.name = f"OSCSC{int(round(housing['leadCount']))}P{pitch_h}_{bl}X{bw}X{bh}{int(round(ll*100))}X{int(round(lw*100))}{settings['densityLevel']}"
+                prefix = 'OSCSC'
             elif housing.get('side-flat'):
-                pattern.name = f"OSCSF{int(round(housing['leadCount']))}P{pitch_h}_{bl}X{bw}X{bh}{int(round(ll*100))}X{int(round(lw*100))}{settings['densityLevel']}"
+                prefix = 'OSCSF'
             else:
                 # L-lead or C-bend could be added as OSCSL/OSCCL later if needed
-                pattern.name = f"OSC{int(round(housing['leadCount']))}P{pitch_h}_{bl}X{bw}X{bh}{int(round(ll*100))}X{int(round(lw*100))}{settings['densityLevel']}"
+                prefix = 'OSC'
+            pattern.name = f"{prefix}{int(round(housing['leadCount']))}P{pitch_h}_{d.bl_h}X{d.bw_h}X{d.bh_h}{d.ll_h}X{d.lw_h}{settings['densityLevel']}"
 
     if housing.get('corner-concave'):
-        print(f"DEBUG oscillator: input housing = {housing}")
+        debug = _debug_enabled()
+        if debug:
+            _dbg(f"DEBUG oscillator: input housing = {housing}")
         pad_params = calculator.corner_concave(pattern.__dict__, housing)
-        print(f"DEBUG oscillator: calculator.corner_concave returned = {pad_params}")
         pad_params['distance'] = pad_params['distance1']
         housing['pitch'] = pad_params['distance2']
         housing['leadCount'] = 4
-        print(f"DEBUG oscillator: final pad_params distance = {pad_params['distance']}")
-        print(f"DEBUG oscillator: final housing pitch = {housing['pitch']}")
+        if debug:
+            _dbg(f"DEBUG oscillator: calculator.corner_concave returned = {pad_params}")
+            _dbg(f"DEBUG oscillator: final pad_params distance = {pad_params['distance']}, housing pitch = {housing['pitch']}")
         
         # Generate name using calculated lead dimensions (now available in housing)
-        if not getattr(pattern, 'name', None):
-            bl = int(round(housing['bodyLength']['nom'] * 100))
-            bw = int(round(housing['bodyWidth']['nom'] * 100))
-            bh = int(round(housing['height']['max'] * 100))
-            # Use the calculated lead dimensions from the corner_concave calculation
-            ll = housing['leadLength']['nom']  # Lead length (along body length)
-            lw = housing['leadWidth']['nom']   # Lead width (along body width)
-            ll_h = int(round(ll * 100))
-            lw_h = int(round(lw * 100))
+        if _needs_name(pattern):
+            # Use the calculated lead dimensions from the corner_concave calculation:
+            # leadLength runs along the body length, leadWidth along the body width
+            d = HousingDims.extract(housing)
             # Corner concave oscillator naming: OSCC + body dimensions + lead dimensions
-            pattern.name = f"OSCC{bl}X{bw}X{bh}L{ll_h}X{lw_h}{settings['densityLevel']}"
+            pattern.name = f"OSCC{d.bl_h}X{d.bw_h}X{d.bh_h}L{d.ll_h}X{d.lw_h}{settings['densityLevel']}"
             
             # Generate description and tags
-            density_names = {'L': 'Least', 'N': 'Nominal', 'M': 'Most'}
-            density_name = density_names.get(settings['densityLevel'], 'Unknown')
-            
-            bl_mm = housing['bodyLength']['nom']
-            bw_mm = housing['bodyWidth']['nom']
-            bh_mm = housing['height']['max']
-            ll_mm = ll
-            lw_mm = lw
-            
+            density_name = DENSITY_NAMES.get(settings['densityLevel'], 'Unknown')
+
             pattern.description = (
-                f"Crystal Oscillator {bl_mm:.1f}mmx{bw_mm:.1f}mm "
-                f", Body {bl_mm:.2f}mmx{bw_mm:.2f}mm, "
-                f"Height {bh_mm:.2f}mm, Lead {ll_mm:.2f}mmx{lw_mm:.2f}mm, "
+                f"Crystal Oscillator {d.bl:.1f}mmx{d.bw:.1f}mm "
+                f", Body {d.bl:.2f}mmx{d.bw:.2f}mm, "
+                f"Height {d.bh:.2f}mm, Lead {d.ll:.2f}mmx{d.lw:.2f}mm, "
                 f"{density_name} Density"
             )
             pattern.tags = "oscillator"
@@ -81,14 +71,13 @@ def build(pattern, element):
             'shape': 'rectangle',
             'width': pad_params['width'],
             'height': pad_params['height'],
-            'layer': ['topCopper', 'topMask', 'topPaste'],
+            'layer': copper.LAYERS_SMD_TOP,
         }
         # Custom numbering for corner concave oscillator: [4, 1, 3, 2]
         # This places pad 4 at bottom-left, 1 at top-left, 3 at top-right, 2 at bottom-right
         pad_params['order'] = 'custom'
         pad_params['custom_numbers'] = [4, 1, 3, 2]
         copper.dual(pattern, element, pad_params)
-        from ..common import silkscreen
         silkscreen.corner_concave(pattern, housing)
         assembly.corner_concave(pattern, housing)
         courtyard.boundary(pattern, housing, pad_params['courtyard'])
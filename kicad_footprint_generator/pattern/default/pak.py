@@ -1,14 +1,24 @@
 from ..common import assembly, calculator, copper, courtyard, silkscreen
+from ..common import _needs_name
+from ..common.dims import hundredths
 
 
-def build(pattern, element):
-    housing = element['housing']
-    settings = pattern.settings
-    # Normalize fields that may be provided as scalars or missing 'nom'
-    def ensure_range(key: str, prefer: str = 'max'):
+# Range fields normalized before calculation, with the limit used when 'nom' is missing
+_RANGE_PREFER = (
+    ('bodyWidth', 'max'),
+    ('bodyLength', 'max'),
+    ('tabWidth', 'min'),
+    ('tabLength', 'min'),
+    ('tabLedge', 'min'),
+)
+
+
+def _ensure_ranges(housing):
+    """Normalize fields that may be provided as scalars or missing 'nom'."""
+    for key, prefer in _RANGE_PREFER:
         val = housing.get(key)
         if val is None:
-            return
+            continue
         if isinstance(val, dict):
             if 'nom' not in val:
                 if prefer in val:
@@ -17,15 +27,19 @@ def build(pattern, element):
                     val['nom'] = val['min']
         else:
             housing[key] = {'min': val, 'nom': val, 'max': val}
-    for k in ('bodyWidth', 'bodyLength', 'tabWidth', 'tabLength', 'tabLedge'):
-        ensure_range(k, prefer='max' if k in ('bodyWidth', 'bodyLength') else 'min')
-    if not getattr(pattern, 'name', None):
+
+
+def build(pattern, element):
+    housing = element['housing']
+    settings = pattern.settings
+    _ensure_ranges(housing)
+    if _needs_name(pattern):
         bl = housing.get('bodyLength', {})
         bw = housing.get('bodyWidth', {})
         blv = bl.get('nom', bl.get('max', 0)) if isinstance(bl, dict) else bl
         bwv = bw.get('nom', bw.get('max', 0)) if isinstance(bw, dict) else bw
         pattern.name = (
-            f"TO{int(round(housing['pitch']*100))}P{int(round(blv*100))}X{int(round(bwv*100))}X{int(round(housing['height']['max']*100))}-{int(round(housing['leadCount']))}{settings['densityLevel']}"
+            f"TO{hundredths(housing['pitch'])}P{hundredths(blv)}X{hundredths(bwv)}X{hundredths(housing['height']['max'])}-{int(round(housing['leadCount']))}{settings['densityLevel']}"
         )
 
     pad_params = calculator.pak(pattern.__dict__, housing)
@@ -35,7 +49,7 @@ def build(pattern, element):
         'shape': 'rectangle',
         'width': pad_params['width1'],
         'height': pad_params['height1'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
+        'layer': copper.LAYERS_SMD_TOP,
     }
     pitch = housing['pitch']
     lead_count = housing['leadCount']
@@ -43,12 +57,11 @@ def build(pattern, element):
     pins = element['pins']
     pad_left = dict(pad)
     pad_left['x'] = -pad_params['distance1'] / 2
-    y = -pitch * (lead_count / 2 - 0.5)
+    y0 = -pitch * (lead_count / 2 - 0.5)
     for i in range(1, lead_count + 1):
-        pad_left['y'] = y
         if str(i) in pins:
+            pad_left['y'] = y0 + (i - 1) * pitch
             pattern.pad(i, pad_left)
-        y += pitch
 
     pad_tab = dict(pad)
     pad_tab['width'] = pad_params['width2']
@@ -1,4 +1,6 @@
 from ..common import two_pin as tp
+from ..common import DENSITY_NAMES, _needs_name
+from ..common.dims import HousingDims, midpoint_nom
 
 
 def build(pattern, element):
@@ -10,31 +12,21 @@ def build(pattern, element):
     housing['polarized'] = True
     
     # Implement new naming scheme and description
-    if not getattr(pattern, 'name', None):
-        # Extract dimensions for naming
-        ls = int(round(housing['leadSpan']['nom'] * 100))
-        bw = int(round(housing['bodyWidth']['nom'] * 100))
-        bh = int(round(housing.get('height', {}).get('max', 0) * 100))
-        ll = housing.get('leadLength', {}).get('nom', (housing.get('leadLength', {}).get('min', 0) + housing.get('leadLength', {}).get('max', 0)) / 2)
-        lw = housing.get('leadWidth', {}).get('nom', (housing.get('leadWidth', {}).get('min', 0) + housing.get('leadWidth', {}).get('max', 0)) / 2)
+    if _needs_name(pattern):
+        # Extract dimensions for naming and description
+        d = HousingDims.extract(housing, lead=midpoint_nom)
         
         # SODFL naming: SODFL + LeadSpan X BodyWidth X Height + L LeadLength X Width
-        pattern.name = f"SODFL{ls:03d}X{bw:03d}X{bh:03d}L{int(round(ll*100)):03d}X{int(round(lw*100)):03d}{pattern.settings['densityLevel']}"
+        pattern.name = f"SODFL{d.ls_h:03d}X{d.bw_h:03d}X{d.bh_h:03d}L{d.ll_h:03d}X{d.lw_h:03d}{pattern.settings['densityLevel']}"
         
         # Generate description and tags
-        density_desc = {'L': 'Least', 'N': 'Nominal', 'M': 'Most'}[pattern.settings['densityLevel']]
-        
-        ls_mm = housing['leadSpan']['nom']
-        bw_mm = housing['bodyWidth']['nom']
-        bh_mm = housing.get('height', {}).get('max', 0)
-        ll_mm = ll
-        lw_mm = lw
+        density_desc = DENSITY_NAMES[pattern.settings['densityLevel']]
         
         pattern.description = (
             f"Small Outline Diode, Flat Lead (SODFL), "
-            f"Lead Span {ls_mm:.2f}mm, "
-            f"Body {bw_mm:.2f}mm x {bh_mm:.2f}mm, "
-            f"Lead {ll_mm:.2f}mm x {lw_mm:.2f}mm, "
+            f"Lead Span {d.ls:.2f}mm, "
+            f"Body {d.bw:.2f}mm x {d.bh:.2f}mm, "
+            f"Lead {d.ll:.2f}mm x {d.lw:.2f}mm, "
             f"{density_desc} Density"
         )
         pattern.tags = "diode"
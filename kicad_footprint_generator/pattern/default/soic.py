@@ -1,4 +1,6 @@
 from ..common import dual as dual_mod
+from ..common import DENSITY_NAMES, _needs_description
+from ..common.dims import HousingDims
 
 
 def build(pattern, element):
@@ -8,24 +10,16 @@ def build(pattern, element):
     housing['polarized'] = True
     
     # Generate description and tags for SOIC
-    if not hasattr(pattern, 'description'):
+    if _needs_description(pattern):
         pin_count = housing.get('leadCount', 0)
         pitch = housing.get('pitch', 1.27)
-        bl = housing.get('bodyLength', {}).get('nom', 0)
-        bw = housing.get('bodyWidth', {}).get('nom', 0) 
-        h = housing.get('height', {}).get('max', 0)
-        ll = housing.get('leadLength', {}).get('nom', 0)
-        lw = housing.get('leadWidth', {}).get('nom', 0)
+        d = HousingDims.extract(housing)
         
-        density_desc = {
-            'L': 'Least',
-            'N': 'Nominal', 
-            'M': 'Most'
-        }.get(pattern.settings.get('densityLevel', 'N'), 'Nominal')
+        density_desc = DENSITY_NAMES.get(pattern.settings.get('densityLevel', 'N'), 'Nominal')
         
         pattern.description = (f"Small Outline Integrated Circuit (SOIC), {pin_count} Pin "
-                             f"({pitch:.2f}mm pitch), Body {bl:.2f}mm x {bw:.2f}mm x {h:.2f}mm, "
-                             f"Lead {ll:.2f}mm x {lw:.2f}mm, {density_desc} Density")
+                             f"({pitch:.2f}mm pitch), Body {d.bl:.2f}mm x {d.bw:.2f}mm x {d.bh:.2f}mm, "
+                             f"Lead {d.ll:.2f}mm x {d.lw:.2f}mm, {density_desc} Density")
         pattern.tags = "soic ic"
     
     # Naming handled in common.dual.build
@@ -1,4 +1,6 @@
 from ..common import mask, copper, silkscreen, assembly, courtyard, calculator
+from ..common import DENSITY_NAMES, _needs_name
+from ..common.dims import HousingDims, hundredths, midpoint_nom
 
 
 def build(pattern, element):
@@ -9,76 +11,29 @@ def build(pattern, element):
     
     # SOJ doesn't support thermal pads (like SOP but without thermal pad logic)
     
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         # SOJ naming: SOJ + PinQty + P + Pitch_BodyLength X LeadSpan X Height + L + LeadWidth
         pin_count = int(housing['leadCount'])
-        pitch_h = int(round(housing['pitch'] * 100))
-        bl = int(round(housing['bodyLength']['nom'] * 100))
-        ls = int(round(housing['leadSpan']['nom'] * 100))
-        bh = int(round(housing['height']['max'] * 100))
+        pitch_h = hundredths(housing['pitch'])
+        # Lead width is nominal, or the midpoint of min/max when no nominal is given
+        d = HousingDims.extract(housing, lead=midpoint_nom)
         
-        # Get lead width (use nominal, calculate from min/max if needed)
-        lw = housing.get('leadWidth', {}).get('nom')
-        if lw is None:
-            lw_min = housing.get('leadWidth', {}).get('min', 0)
-            lw_max = housing.get('leadWidth', {}).get('max', 0)
-            lw = (lw_min + lw_max) / 2 if lw_max > 0 else 0
-        lw_h = int(round(lw * 100))
-        
-        pattern.name = f"SOJ{pin_count}P{pitch_h:03d}_{bl:03d}X{ls:03d}X{bh:03d}L{lw_h:03d}{settings['densityLevel']}"
+        pattern.name = f"SOJ{pin_count}P{pitch_h:03d}_{d.bl_h:03d}X{d.ls_h:03d}X{d.bh_h:03d}L{d.lw_h:03d}{settings['densityLevel']}"
         
         # Generate description
-        density_desc = {"L": "Least", "N": "Nominal", "M": "Most"}[settings['densityLevel']]
+        density_desc = DENSITY_NAMES[settings['densityLevel']]
         pitch = housing['pitch']
-        body_l = housing['bodyLength']['nom']
-        body_w = housing['bodyWidth']['nom']
-        h = housing['height']['max']
-        lead_span = housing['leadSpan']['nom']
         
         pattern.description = (f"Small Outline J-Lead (SOJ), {pin_count} Pin "
-                              f"({pitch:.2f}mm pitch), Body {body_l:.2f}mm x {body_w:.2f}mm x {h:.2f}mm, "
-                              f"Lead Span {lead_span:.2f}mm, Lead Width {lw:.2f}mm, {density_desc} Density")
+                              f"({pitch:.2f}mm pitch), Body {d.bl:.2f}mm x {d.bw:.2f}mm x {d.bh:.2f}mm, "
+                              f"Lead Span {d.ls:.2f}mm, Lead Width {d.lw:.2f}mm, {density_desc} Density")
         pattern.tags = "soj"
     
     # Calculate pad parameters using custom SOJ calculator
     pad_params = calculator.soj(pattern.__dict__, housing)
     
     # Generate pin layout - dual package (similar to SOP but without thermal pad)
-    pin_count = int(housing['leadCount'])
-    pins_per_side = pin_count // 2
-    pitch = housing['pitch']
-    
-    # Create pad template
-    pad = {
-        'type': 'smd',
-        'shape': 'roundrect',
-        'width': pad_params['width'],
-        'height': pad_params['height'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
-        'roundrect_rratio': min(0.25, 0.1 / min(pad_params['width'], pad_params['height']))
-    }
-    
-    # Generate left side pins (1 to pins_per_side)
-    pad_distance = pad_params['distance']
-    
-    y = -(pins_per_side - 1) * pitch / 2
-    for i in range(pins_per_side):
-        pin_number = i + 1
-        pad_left = dict(pad)
-        pad_left['x'] = -pad_distance / 2
-        pad_left['y'] = y
-        pattern.pad(pin_number, pad_left)
-        y += pitch  # Move down for next pin
-    
-    # Generate right side pins (pins_per_side+1 to pin_count)
-    y = -(pins_per_side - 1) * pitch / 2
-    for i in range(pins_per_side):
-        pin_number = pin_count - i  # Count down from highest pin
-        pad_right = dict(pad)
-        pad_right['x'] = pad_distance / 2
-        pad_right['y'] = y
-        pattern.pad(pin_number, pad_right)
-        y += pitch  # Move down for next pin
+    copper.roundrect_rows(pattern, housing, pad_params)
     
     # Apply SOP-like silkscreen, assembly, etc.
     copper.mask(pattern)
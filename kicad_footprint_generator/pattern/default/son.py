@@ -1,4 +1,29 @@
+from functools import lru_cache
+
 from ..common import assembly, calculator, copper, courtyard, silkscreen
+from ..common import DENSITY_NAMES, _needs_name
+from ..common.dims import HousingDims, hundredths, resolve_range
+
+
+def _get_nominal(param_dict):
+    if isinstance(param_dict, dict):
+        if 'nom' in param_dict:
+            return param_dict['nom']
+        elif 'min' in param_dict and 'max' in param_dict:
+            # Compute nominal as average of min/max
+            return (param_dict['min'] + param_dict['max']) / 2
+        else:
+            return param_dict.get('max', param_dict.get('min', 0))
+    return param_dict or 0
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _son_name(pin_count, pitch_h, bl_h, bw_h, bh_h, ll_h, lw_h, tab_h, density_level):
+    """SON name from 0.01 mm dimensions, zero-padded to 3 digits; tab_h is (length, width) or None"""
+    base = f"SON{pin_count}P{pitch_h:03d}_{bl_h:03d}X{bw_h:03d}X{bh_h:03d}L{ll_h:03d}X{lw_h:03d}"
+    if tab_h:
+        return f"{base}T{tab_h[0]:03d}X{tab_h[1]:03d}{density_level}"
+    return f"{base}{density_level}"
 
 
 def build(pattern, element):
@@ -11,66 +36,34 @@ def build(pattern, element):
     if has_tab:
         lead_count += 1
 
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         # SON naming: SON+PinQty.+P Pitch_BodyLength X Width X Height+L LeadLength X Width+T ThermalPadLength X Width
-        pitch_h = int(round(housing['pitch'] * 100))
-        bl = int(round(housing['bodyLength']['nom'] * 100))
-        bw = int(round(housing['bodyWidth']['nom'] * 100))
-        bh = int(round(housing['height']['max'] * 100))
-        
-        # Get lead dimensions (use nominal values, compute from min/max if not available)
-        def get_nominal(param_dict):
-            if isinstance(param_dict, dict):
-                if 'nom' in param_dict:
-                    return param_dict['nom']
-                elif 'min' in param_dict and 'max' in param_dict:
-                    # Compute nominal as average of min/max
-                    return (param_dict['min'] + param_dict['max']) / 2
-                else:
-                    return param_dict.get('max', param_dict.get('min', 0))
-            return param_dict or 0
-        
-        ll = get_nominal(housing.get('leadLength', {}))
-        lw = get_nominal(housing.get('leadWidth', {}))
-        
-        def _nom(v):
-            if isinstance(v, dict):
-                return v.get('nom', v.get('max', v.get('min', 0)))
-            return v
-        
-        # Build name components with proper zero-padding to 3 digits
-        # Use actual leadCount from housing, not the modified lead_count variable
-        actual_pin_count = housing['leadCount']
-        name_parts = [
-            f"SON{actual_pin_count}",
-            f"P{pitch_h:03d}",  # 3-digit pitch
-            f"_{bl:03d}X{bw:03d}X{bh:03d}",  # Body dimensions
-            f"L{int(round(ll*100)):03d}X{int(round(lw*100)):03d}"  # Lead dimensions
-        ]
+        pitch_h = hundredths(housing['pitch'])
+        # Lead dimensions use nominal values, computed from min/max if not available
+        d = HousingDims.extract(housing, lead=_get_nominal)
         
         # Add thermal pad if present
-        tw = housing.get('tabWidth')
-        tl = housing.get('tabLength')
-        if (_nom(tw) or 0) > 0 and (_nom(tl) or 0) > 0:
-            name_parts.append(f"T{int(round(_nom(tl)*100)):03d}X{int(round(_nom(tw)*100)):03d}")
+        tab_w = resolve_range(housing.get('tabWidth'))
+        tab_l = resolve_range(housing.get('tabLength'))
+        has_thermal = (tab_w or 0) > 0 and (tab_l or 0) > 0
+        tab_h = (hundredths(tab_l), hundredths(tab_w)) if has_thermal else None
         
-        pattern.name = "".join(name_parts) + settings['densityLevel']
+        # Use actual leadCount from housing, not the modified lead_count variable
+        pattern.name = _son_name(housing['leadCount'], pitch_h, d.bl_h, d.bw_h, d.bh_h,
+                                 d.ll_h, d.lw_h, tab_h, settings['densityLevel'])
         
         # Generate description and tags
         pitch = housing['pitch']
         pin_count = housing['leadCount']
-        bl = housing['bodyLength']['nom']
-        bw = housing['bodyWidth']['nom']
-        h = housing['height']['max']
-        density_desc = {'L': 'Least', 'N': 'Nominal', 'M': 'Most'}[settings['densityLevel']]
+        density_desc = DENSITY_NAMES[settings['densityLevel']]
         
         thermal_desc = ""
-        if (_nom(tw) or 0) > 0 and (_nom(tl) or 0) > 0:
-            thermal_desc = f", Thermal Pad {_nom(tl):.2f}mm x {_nom(tw):.2f}mm"
+        if has_thermal:
+            thermal_desc = f", Thermal Pad {tab_l:.2f}mm x {tab_w:.2f}mm"
         
         pattern.description = (f"Small Outline No-Lead (SON), {pin_count} Pin "
-                             f"({pitch:.2f}mm pitch), Body {bl:.2f}mm x {bw:.2f}mm x {h:.2f}mm, "
-                             f"Lead {ll:.2f}mm x {lw:.2f}mm{thermal_desc}, {density_desc} Density")
+                             f"({pitch:.2f}mm pitch), Body {d.bl:.2f}mm x {d.bw:.2f}mm x {d.bh:.2f}mm, "
+                             f"Lead {d.ll:.2f}mm x {d.lw:.2f}mm{thermal_desc}, {density_desc} Density")
         pattern.tags = "son ic"
 
     pad_params = calculator.son(pattern.__dict__, housing)
@@ -80,14 +73,14 @@ def build(pattern, element):
         'shape': 'rectangle',
         'width': pad_params['width'],
         'height': pad_params['height'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
+        'layer': copper.LAYERS_SMD_TOP,
     }
 
     copper.dual(pattern, element, pad_params)
 
     if 'width1' in pad_params:
         # adjust first pad width and x offset
-        first_key = sorted(pattern.pads.keys(), key=lambda k: int(k) if k.isdigit() else k)[0]
+        first_key = min(pattern.pads, key=lambda k: (0, int(k), '') if k.isdigit() else (1, 0, k))
         first_pad = pattern.pads[first_key]
         width1 = pad_params['width1']
         dx = (width1 - first_pad.width) / 2
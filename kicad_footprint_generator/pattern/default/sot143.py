@@ -1,19 +1,21 @@
 from ..common import assembly, calculator, copper, courtyard, silkscreen
+from ..common import _needs_name
+from ..common.dims import hundredths, resolve_range
 
 
 def build(pattern, element):
     housing = element['housing']
     housing['polarized'] = True
     settings = pattern.settings
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         # SOT143 naming like SOT23 style
-        pitch_h = int(round(housing['pitch'] * 100))
-        ls = int(round(housing['leadSpan']['nom'] * 100))
-        bw = int(round(housing['bodyWidth']['nom'] * 100))
-        bh = int(round(housing['height']['max'] * 100))
-        ll = housing.get('leadLength', {}).get('nom', housing.get('leadLength', {}).get('max', housing.get('leadLength', {}).get('min', 0)))
-        lw = housing.get('leadWidth', {}).get('nom', housing.get('leadWidth', {}).get('max', housing.get('leadWidth', {}).get('min', 0)))
-        pattern.name = f"SOT143{int(round(housing['leadCount']))}P{pitch_h}_{ls:03d}X{bw:03d}X{bh:03d}{int(round(ll*100)):03d}X{int(round(lw*100)):03d}{settings['densityLevel']}"
+        pitch_h = hundredths(housing['pitch'])
+        ls = hundredths(housing['leadSpan']['nom'])
+        bw = hundredths(housing['bodyWidth']['nom'])
+        bh = hundredths(housing['height']['max'])
+        ll = resolve_range(housing.get('leadLength'))
+        lw = resolve_range(housing.get('leadWidth'))
+        pattern.name = f"SOT143{int(round(housing['leadCount']))}P{pitch_h}_{ls:03d}X{bw:03d}X{bh:03d}{hundredths(ll):03d}X{hundredths(lw):03d}{settings['densityLevel']}"
 
     pad_params = calculator.sot(pattern.__dict__, housing)
 
@@ -22,14 +24,14 @@ def build(pattern, element):
         'shape': 'rectangle',
         'width': pad_params['width1'],
         'height': pad_params['height1'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
+        'layer': copper.LAYERS_SMD_TOP,
     }
     pad2 = {
         'type': 'smd',
         'shape': 'rectangle',
         'width': pad_params['width2'],
         'height': pad_params['height2'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
+        'layer': copper.LAYERS_SMD_TOP,
     }
 
     if housing.get('reversed'):
@@ -1,44 +1,39 @@
+from functools import lru_cache
+
 from ..common import assembly, calculator, copper, courtyard, silkscreen
+from ..common import _needs_name
+from ..common.dims import HousingDims, hundredths, resolve_range
+
+
+@lru_cache(maxsize=4096)
+def _sot223_name(lead_count, pitch_h, ls_h, bw_h, bh_h, ll_h, lw_h, density_level):
+    """SOT223 name from 0.01 mm dimensions"""
+    return f"SOT223{lead_count}P{pitch_h}_{ls_h:03d}X{bw_h:03d}X{bh_h:03d}{ll_h:03d}X{lw_h:03d}{density_level}"
 
 
 def build(pattern, element):
     housing = element['housing']
     housing['polarized'] = True
     settings = pattern.settings
-    if not getattr(pattern, 'name', None):
-        pitch_h = int(round(housing['pitch'] * 100))
-        ls = int(round(housing['leadSpan']['nom'] * 100))
-        bw = int(round(housing['bodyWidth']['nom'] * 100))
-        bh = int(round(housing['height']['max'] * 100))
-        ll = housing.get('leadLength', {}).get('nom', housing.get('leadLength', {}).get('max', housing.get('leadLength', {}).get('min', 0)))
-        lw = housing.get('leadWidth', {}).get('nom', housing.get('leadWidth', {}).get('max', housing.get('leadWidth', {}).get('min', 0)))
-        pattern.name = f"SOT223{int(round(housing['leadCount']))}P{pitch_h}_{ls:03d}X{bw:03d}X{bh:03d}{int(round(ll*100)):03d}X{int(round(lw*100)):03d}{settings['densityLevel']}"
+    lead_count = housing['leadCount']
+    if _needs_name(pattern):
+        pitch_h = hundredths(housing['pitch'])
+        d = HousingDims.extract(housing, lead=resolve_range)
+        pattern.name = _sot223_name(int(round(lead_count)), pitch_h, d.ls_h, d.bw_h, d.bh_h,
+                                    d.ll_h, d.lw_h, settings['densityLevel'])
 
     pad_params = calculator.sot(pattern.__dict__, housing)
 
-    pad = {
-        'type': 'smd',
-        'shape': 'rectangle',
-        'width': pad_params['width1'],
-        'height': pad_params['height1'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
-    }
-
-    left_count = housing['leadCount'] - 1
-    pad_left = dict(pad)
-    pad_left['x'] = -pad_params['distance'] / 2
-    y = -housing['pitch'] * (left_count / 2 - 0.5)
-    for i in range(1, left_count + 1):
-        pad_left['y'] = y
-        pattern.pad(i, pad_left)
-        y += housing['pitch']
-
-    pad_right = dict(pad)
-    pad_right['x'] = pad_params['distance'] / 2
-    pad_right['y'] = 0
-    pad_right['width'] = pad_params['width2']
-    pad_right['height'] = pad_params['height2']
-    pattern.pad(left_count + 1, pad_right)
+    layers = copper.LAYERS_SMD_TOP
+    width, height = pad_params['width1'], pad_params['height1']
+    left_count = lead_count - 1
+    x = pad_params['distance'] / 2
+    pitch = housing['pitch']
+    y0 = -pitch * (left_count / 2 - 0.5)
+    for i in range(left_count):
+        pattern.smd_pad(i + 1, -x, y0 + i * pitch, width, height, layers)
+
+    pattern.smd_pad(left_count + 1, x, 0, pad_params['width2'], pad_params['height2'], layers)
 
     copper.mask(pattern)
     silkscreen.dual(pattern, housing)
@@ -1,4 +1,6 @@
 from ..common import assembly, calculator, copper, courtyard, mask, silkscreen
+from ..common import DENSITY_NAMES, _needs_name
+from .sop import build as sop_build
 
 
 def build(pattern, element):
@@ -7,7 +9,7 @@ def build(pattern, element):
     housing['sot23'] = True  # Flag for SOT-23-specific silkscreen/assembly
     settings = pattern.settings
     flatlead = housing.get('flatlead', False)
-    if not getattr(pattern, 'name', None):
+    if _needs_name(pattern):
         # SOT23 naming: SOT23-{leadCount}P{pitch}_{leadSpan}X{bodyWidth}X{height}L{leadLength}X{leadWidth}{density}
         pitch_h = int(round(housing['pitch'] * 100))
         ls = int(round(housing['leadSpan']['nom'] * 100))
@@ -38,7 +40,7 @@ def build(pattern, element):
         body_w = housing['bodyWidth']['nom']
         body_l = housing['bodyLength']['nom']
         h = housing['height']['max']
-        density_desc = {'L': 'Least', 'N': 'Nominal', 'M': 'Most'}[settings['densityLevel']]
+        density_desc = DENSITY_NAMES[settings['densityLevel']]
         
         pattern.description = (f"Small Outline Transistor (SOT-23), {pin_count} Pin "
                              f"({pitch:.2f}mm pitch), Body {body_l:.2f}mm x {body_w:.2f}mm x {h:.2f}mm, "
@@ -46,7 +48,6 @@ def build(pattern, element):
         pattern.tags = "sot23"
 
     if housing['leadCount'] % 2 == 0 and housing['leadCount'] != 6:
-        from .sop import build as sop_build
         return sop_build(pattern, element)
 
     # Ensure leadWidth1 and leadWidth2 are set for sot() function
@@ -74,7 +75,7 @@ def build(pattern, element):
         'shape': 'rectangle',
         'width': pad_params['width1'],
         'height': pad_params['height1'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
+        'layer': copper.LAYERS_SMD_TOP,
     }
 
     pad_left = dict(pad)
@@ -128,8 +129,8 @@ def _sot23_silkscreen(pattern, housing):
     if housing['leadCount'] == 3:
         # Get the third pad (single pad on right side)
         pad3 = pattern.pads['3']  # pad numbering: 1,2 on left, 3 on right
-        pad3_y_top = pad3.y + pad3.height / 2 + gap
-        pad3_y_bottom = pad3.y - pad3.height / 2 - gap
+        pad3_y_top = pad3.y + pad3.half_height + gap
+        pad3_y_bottom = pad3.y - pad3.half_height - gap
         
         # Offset vertical lines outside body by half line width (0.12/2 = 0.06)
         line_offset = lw / 2
@@ -200,5 +201,5 @@ def _sot23_silkscreen(pattern, housing):
             dot1_x = max_left_offset
         
         # Draw pin 1 dot (filled circle, 0.2mm radius like original)
-        pattern.layer('topSilkscreen').lineWidth(0.1).fill(True).circle(dot1_x, dot1_y, 0.2).fill(False)
+        pattern.filled_circle('topSilkscreen', 0.1, dot1_x, dot1_y, 0.2)
 
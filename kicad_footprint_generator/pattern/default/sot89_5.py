@@ -1,57 +1,38 @@
+from functools import lru_cache
+
 from ..common import assembly, calculator, copper, courtyard
 from ..common import silkscreen
+from ..common import _needs_name
+from ..common.dims import hundredths
+
+
+@lru_cache(maxsize=4096)
+def _sot89_5_name(pitch_h, ls_h, bh_h, lead_count, density_level):
+    """SOTFL name from 0.01 mm dimensions"""
+    return f"SOTFL{pitch_h}P{ls_h}X{bh_h}-{lead_count}{density_level}"
 
 
 def build(pattern, element):
     housing = element['housing']
     housing['polarized'] = True
     housing['flatlead'] = True
-    housing.setdefault('leadCount', 5)
+    lead_count = housing.setdefault('leadCount', 5)
     settings = pattern.settings
-    if not getattr(pattern, 'name', None):
-        pattern.name = (
-            f"SOTFL{int(round(housing['pitch']*100))}P{int(round(housing['leadSpan']['nom']*100))}X{int(round(housing['height']['max']*100))}-{int(round(housing['leadCount']))}{settings['densityLevel']}"
-        )
+    if _needs_name(pattern):
+        pattern.name = _sot89_5_name(hundredths(housing['pitch']), hundredths(housing['leadSpan']['nom']),
+                                     hundredths(housing['height']['max']), int(round(lead_count)),
+                                     settings['densityLevel'])
 
     pad_params = calculator.sot(pattern.__dict__, housing)
-    pad1 = {
-        'type': 'smd',
-        'shape': 'rectangle',
-        'width': pad_params['width1'],
-        'height': pad_params['height1'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
-    }
-    pad2 = {
-        'type': 'smd',
-        'shape': 'rectangle',
-        'x': 0,
-        'y': 0,
-        'width': pad_params['width2'] + pad_params['distance'],
-        'height': pad_params['height2'],
-        'layer': ['topCopper', 'topMask', 'topPaste'],
-    }
-
-    p1 = dict(pad1)
-    p1['x'] = -pad_params['distance'] / 2
-    p1['y'] = -housing['pitch']
-    pattern.pad(1, p1)
-
-    pattern.pad(2, pad2)
-
-    p3 = dict(pad1)
-    p3['x'] = -pad_params['distance'] / 2
-    p3['y'] = housing['pitch']
-    pattern.pad(3, p3)
-
-    p4 = dict(pad1)
-    p4['x'] = pad_params['distance'] / 2
-    p4['y'] = housing['pitch']
-    pattern.pad(4, p4)
-
-    p5 = dict(pad1)
-    p5['x'] = pad_params['distance'] / 2
-    p5['y'] = -housing['pitch']
-    pattern.pad(5, p5)
+    layers = copper.LAYERS_SMD_TOP
+    width, height = pad_params['width1'], pad_params['height1']
+    x = pad_params['distance'] / 2
+    pitch = housing['pitch']
+    pattern.smd_pad(1, -x, -pitch, width, height, layers)
+    pattern.smd_pad(2, 0, 0, pad_params['width2'] + pad_params['distance'], pad_params['height2'], layers)
+    pattern.smd_pad(3, -x, pitch, width, height, layers)
+    pattern.smd_pad(4, x, pitch, width, height, layers)
+    pattern.smd_pad(5, x, -pitch, width, height, layers)
 
     copper.mask(pattern)
     silkscreen.dual(pattern, housing)
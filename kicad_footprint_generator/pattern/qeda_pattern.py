@@ -1,20 +1,54 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from ..kicad_writer import PatternShape
+from ..kicad_writer import AttributeShape, CircleShape, LineShape, PatternShape, RectShape, Shape
+
+
+@lru_cache(maxsize=1024)
+def _parse_points(value: str) -> Tuple[Tuple[float, float], ...]:
+    # "x1, y1, x2, y2, ..." -> ((x1, y1), (x2, y2), ...); a trailing lone x gets y = 0
+    values = [float(v) for v in value.replace(' ', '').split(',') if v]
+    points = []
+    for i in range(0, len(values), 2):
+        x = values[i]
+        y = values[i + 1] if i + 1 < len(values) else 0.0
+        points.append((x, y))
+    return tuple(points)
+
+
+def _pad_order(name: str) -> Tuple[int, int | str]:
+    # Numeric pad names order by value, ahead of any non-numeric names
+    try:
+        return (0, int(name))
+    except Exception:
+        return (1, name)
+
+
+@lru_cache(maxsize=None)
+def _single_layer(name: str) -> Tuple[str, ...]:
+    return (name,)
+
+
+def _as_layers(layer: Sequence[str] | str) -> Sequence[str]:
+    # Layer sets are only read once stored on a shape, so a bare layer name maps to
+    # one shared 1-tuple and lists/tuples (e.g. copper.LAYERS_SMD_TOP) pass through.
+    return layer if isinstance(layer, (list, tuple)) else _single_layer(layer)
 
 
 @dataclass
 class QedaPattern:
+    # Read as a plain dict: a build touches only a few keys, so a per-pattern view
+    # would cost as much to build as it saves; hot helpers hoist values into locals.
     settings: dict
     decimals: int
     name: str
     type: str = 'smd'
-    shapes: List[PatternShape] = field(default_factory=list)
+    shapes: List[Shape] = field(default_factory=list)
     pads: Dict[str, PatternShape] = field(default_factory=dict)
-    current_layer: List[str] = field(default_factory=lambda: ['topCopper'])
+    current_layer: Sequence[str] = ('topCopper',)
     current_line_width: float = 0.0
     current_fill: bool = False
     cx: float = 0.0
@@ -22,8 +56,7 @@ class QedaPattern:
 
     def attribute(self, name: str, attr: dict) -> 'QedaPattern':
         self.shapes.append(
-            PatternShape(
-                kind='attribute',
+            AttributeShape(
                 name=name,
                 x=self.cx + attr.get('x', 0.0),
                 y=self.cy + attr.get('y', 0.0),
@@ -38,13 +71,22 @@ class QedaPattern:
         return self
 
     def center(self, x: float, y: float) -> 'QedaPattern':
+        # The emitters always add cx/cy, even at the origin: the add also turns a -0.0
+        # coordinate into 0.0, which keeps "-0.000" out of the written footprint.
         self.cx = x
         self.cy = y
         return self
 
     def circle(self, x: float, y: float, radius: float) -> 'QedaPattern':
         self.shapes.append(
-            PatternShape(kind='circle', x=self.cx + x, y=self.cy + y, radius=radius, lineWidth=self.current_line_width, layer=self.current_layer, fill=self.current_fill)
+            CircleShape(x=self.cx + x, y=self.cy + y, radius=radius, lineWidth=self.current_line_width, layer=self.current_layer, fill=self.current_fill)
+        )
+        return self
+
+    def filled_circle(self, layer: Sequence[str] | str, line_width: float, x: float, y: float, radius: float) -> 'QedaPattern':
+        """Filled circle on `layer`; unlike the layer/lineWidth/fill chain, the current drawing state is left untouched."""
+        self.shapes.append(
+            CircleShape(x=self.cx + x, y=self.cy + y, radius=radius, lineWidth=line_width, layer=_as_layers(layer), fill=True)
         )
         return self
 
@@ -52,19 +94,30 @@ class QedaPattern:
         self.current_fill = enable
         return self
 
-    def layer(self, layer: List[str] | str) -> 'QedaPattern':
-        if not isinstance(layer, list):
-            layer = [layer]
-        self.current_layer = layer
+    def layer(self, layer: Sequence[str] | str) -> 'QedaPattern':
+        self.current_layer = _as_layers(layer)
         return self
 
     def line(self, x1: float, y1: float, x2: float, y2: float) -> 'QedaPattern':
         if (x1 != x2) or (y1 != y2):
             self.shapes.append(
-                PatternShape(kind='line', x1=self.cx + x1, y1=self.cy + y1, x2=self.cx + x2, y2=self.cy + y2, lineWidth=self.current_line_width, layer=self.current_layer)
+                LineShape(x1=self.cx + x1, y1=self.cy + y1, x2=self.cx + x2, y2=self.cy + y2, lineWidth=self.current_line_width, layer=self.current_layer)
             )
         return self
 
+    def lines(self, segments: Iterable[Tuple[float, float, float, float]]) -> 'QedaPattern':
+        """Batch form of `line()`: append every non-degenerate (x1, y1, x2, y2) segment."""
+        cx, cy = self.cx, self.cy
+        line_width, layer = self.current_line_width, self.current_layer
+        # Exact compare, as in line(): only segments whose ends are bit-identical are
+        # dropped. The test is folded into the one extend() that builds the shapes anyway.
+        self.shapes.extend(
+            LineShape(x1=cx + x1, y1=cy + y1, x2=cx + x2, y2=cy + y2, lineWidth=line_width, layer=layer)
+            for x1, y1, x2, y2 in segments
+            if (x1 != x2) or (y1 != y2)
+        )
+        return self
+
     def lineWidth(self, line_width: float) -> 'QedaPattern':
         self.current_line_width = line_width
         return self
@@ -78,6 +131,11 @@ class QedaPattern:
         self.line(self.x, self.y, x, y)
         return self.moveTo(x, y)
 
+    def polyline(self, points: Sequence[Tuple[float, float]]) -> 'QedaPattern':
+        """Batch form of `moveTo(p0).lineTo(p1).lineTo(p2)...`; leaves the pen at the last point."""
+        self.lines((x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(points, points[1:]))
+        return self.moveTo(*points[-1])
+
     def pad(self, name: str | int, pad: dict) -> 'QedaPattern':
         n = str(name)
         shape = PatternShape(
@@ -106,32 +164,49 @@ class QedaPattern:
             self.type = 'through-hole'
         return self
 
+    def smd_pad(self, name: str | int, x: float, y: float, width: float, height: float,
+                layer: Optional[Sequence[str]] = None, shape: str = 'rectangle') -> 'QedaPattern':
+        """Plain SMD pad from positional geometry; same result as `pad()` with the equivalent dict."""
+        n = str(name)
+        pad = PatternShape(
+            kind='pad',
+            pad_name=n,
+            x=self.cx + x,
+            y=self.cy + y,
+            width=width,
+            height=height,
+            type='smd',
+            shape=shape,
+            layer=self.current_layer if layer is None else layer,
+        )
+        self.pads[n] = pad
+        self.shapes.append(pad)
+        return self
+
     def rectangle(self, x1: float, y1: float, x2: float, y2: float) -> 'QedaPattern':
         if (x1 != x2) or (y1 != y2):
             self.shapes.append(
-                PatternShape(kind='rectangle', x1=self.cx + x1, y1=self.cy + y1, x2=self.cx + x2, y2=self.cy + y2, lineWidth=self.current_line_width, layer=self.current_layer, fill=self.current_fill)
+                RectShape(x1=self.cx + x1, y1=self.cy + y1, x2=self.cx + x2, y2=self.cy + y2, lineWidth=self.current_line_width, layer=self.current_layer, fill=self.current_fill)
             )
         return self
 
     def extreme_pads(self) -> Tuple[PatternShape, PatternShape]:
         if not self.pads:
             return None, None
-        # sort by numeric if possible
-        def keyfn(k: str) -> Tuple[int, str]:
-            try:
-                return (0, int(k))
-            except Exception:
-                return (1, k)
-
-        keys = sorted(self.pads.keys(), key=keyfn)
-        return self.pads[keys[0]], self.pads[keys[-1]]
+        # Single pass; equal keys resolve as a stable sort would (first / last inserted)
+        first = last = None
+        for k in self.pads:
+            order = _pad_order(k)
+            if first is None or order < first[0]:
+                first = (order, k)
+            if last is None or order >= last[0]:
+                last = (order, k)
+        return self.pads[first[1]], self.pads[last[1]]
 
     def parse_position(self, value: str):
-        values = [float(v) for v in value.replace(' ', '').split(',') if v]
-        points = []
-        for i in range(0, len(values), 2):
-            x = values[i]
-            y = values[i + 1] if i + 1 < len(values) else 0.0
-            points.append({'x': x, 'y': y})
-        return points
+        return [{'x': x, 'y': y} for x, y in _parse_points(value)]
+
+    def parse_points(self, value: str) -> Tuple[Tuple[float, float], ...]:
+        """Like `parse_position()`, but returns shared, immutable (x, y) tuples."""
+        return _parse_points(value)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import glob
+import hashlib
 import json
 import os
 import re
@@ -8,7 +9,8 @@ import subprocess
 import tempfile
 import threading
 import traceback
-from typing import Any, Dict, Tuple
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Tuple
 
 import wx
 
@@ -67,7 +69,15 @@ def _run_in_bg(work, done) -> None:
 
 
 _STATE_VERSION = 2
+# Field-path suffixes of min/nom/max range groups (exact, lower-case as saved).
+_RANGE_SUFS = frozenset(("min", "nom", "max"))
 _STATE_MEM: dict[str, Any] | None = None
+# SHA-256 of the state JSON last read from / queued for disk; unchanged state isn't rewritten.
+_STATE_HASH: bytes | None = None
+# Background state writes: newest (path, json, hash) not yet written, and the writer thread.
+_STATE_LOCK = threading.Lock()
+_STATE_PENDING: tuple[str, str, bytes] | None = None
+_STATE_WRITER: threading.Thread | None = None
 
 
 def _state_path() -> str:
@@ -83,23 +93,20 @@ def _state_path() -> str:
 
 
 def _load_state_best_effort() -> dict[str, Any]:
-    global _STATE_MEM
+    global _STATE_MEM, _STATE_HASH
     if _STATE_MEM is not None:
         return _STATE_MEM
     p = _state_path()
     try:
         with open(p, "r", encoding="utf-8") as f:
-            d = json.load(f)
+            raw = f.read()
+        _STATE_HASH = hashlib.sha256(raw.encode("utf-8")).digest()
+        d = json.loads(raw)
         if not isinstance(d, dict):
             d = {}
     except Exception:
         d = {}
     prev_ver = int(d.get("version") or 0) if isinstance(d.get("version"), (int, float, str)) else 0
-    # Basic shape
-    if not isinstance(d, dict):
-        d = {}
-    d.setdefault("global", {})
-    d.setdefault("kinds", {})
 
     # Migration: v1 saved implied `.nom` values for min/nom/max groups.
     # We now keep nominal boxes empty by default (using mean(min,max) as a hint),
@@ -114,25 +121,29 @@ def _load_state_best_effort() -> dict[str, Any]:
                     fields = ks.get("fields", {})
                     if not isinstance(fields, dict):
                         continue
+                    # Kinds without any range field have nothing to migrate.
+                    if not any(isinstance(pth, str) and pth.endswith((".min", ".max", ".nom")) for pth in fields):
+                        continue
                     # Build base -> (min,max,nom) if present.
                     bases: dict[str, dict[str, float]] = {}
-                    for pth, v in list(fields.items()):
+                    for pth, v in fields.items():
                         if not isinstance(pth, str):
                             continue
-                        if not pth.endswith((".min", ".max", ".nom")):
+                        parts = pth.rsplit(".", 1)
+                        if len(parts) != 2 or parts[1] not in _RANGE_SUFS:
                             continue
-                        try:
-                            base, suf = pth.rsplit(".", 1)
-                        except Exception:
-                            continue
-                        suf = suf.strip().lower()
-                        if suf not in ("min", "max", "nom"):
-                            continue
-                        try:
+                        base, suf = parts
+                        if isinstance(v, (int, float)):
                             fv = float(v)
-                        except Exception:
-                            continue
-                        bases.setdefault(base, {})[suf] = fv
+                        else:
+                            try:
+                                fv = float(v)
+                            except Exception:
+                                continue
+                        m = bases.get(base)
+                        if m is None:
+                            m = bases[base] = {}
+                        m[suf] = fv
                     # Drop nom when it's just the mean(min,max).
                     for base, m in bases.items():
                         if not all(x in m for x in ("min", "max", "nom")):
@@ -143,6 +154,7 @@ def _load_state_best_effort() -> dict[str, Any]:
         except Exception:
             pass
 
+    # Basic shape
     d["version"] = _STATE_VERSION
     d.setdefault("global", {})
     d.setdefault("kinds", {})
@@ -155,16 +167,65 @@ def _load_state_best_effort() -> dict[str, Any]:
     return d
 
 
+def _write_state_file(p: str, data: str) -> None:
+    os.makedirs(os.path.dirname(p), exist_ok=True)
+    tmp = p + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data)
+        # Make the bytes durable before the rename, so a crash can't leave an empty
+        # state file (which would also re-run the migration on next start).
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, p)
+
+
+def _state_writer() -> None:
+    """
+    Background writer: flushes the newest queued state until nothing is pending.
+    """
+    global _STATE_PENDING, _STATE_WRITER, _STATE_HASH
+    while True:
+        with _STATE_LOCK:
+            job = _STATE_PENDING
+            _STATE_PENDING = None
+            if job is None:
+                _STATE_WRITER = None
+                return
+        p, data, h = job
+        try:
+            _write_state_file(p, data)
+        except Exception:
+            # Never break UI for persistence; let the next save retry this content.
+            with _STATE_LOCK:
+                if _STATE_HASH == h:
+                    _STATE_HASH = None
+
+
 def _save_state_best_effort(d: dict[str, Any]) -> None:
-    global _STATE_MEM
+    global _STATE_MEM, _STATE_HASH, _STATE_PENDING, _STATE_WRITER
     _STATE_MEM = d
     try:
-        p = _state_path()
-        os.makedirs(os.path.dirname(p), exist_ok=True)
-        tmp = p + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(d, f, indent=2, sort_keys=True)
-        os.replace(tmp, p)
+        # Encode up front and hand the file one string, instead of json.dump()'s
+        # per-token writes. The string also snapshots `d`, which the UI keeps mutating.
+        # It is re-encoded every time rather than cached: every caller edits `d` in place
+        # right before saving, and the hash below needs the fresh encoding anyway.
+        # Compact (no indent): json only uses its C encoder without indentation, and the
+        # file is machine-written. The loader reads this and older indented files alike.
+        data = json.dumps(d, sort_keys=True, separators=(",", ":"))
+        h = hashlib.sha256(data.encode("utf-8")).digest()
+        p = _state_path()  # wx call: resolve on the UI thread
+        # The file write + fsync run on one background writer so the UI doesn't stall on
+        # disk; only the newest state is kept, so saves land in order. It is not a daemon
+        # thread, so a save queued just before exit still completes.
+        with _STATE_LOCK:
+            if h == _STATE_HASH:
+                return
+            _STATE_HASH = h
+            _STATE_PENDING = (p, data, h)
+            if _STATE_WRITER is not None:
+                return
+            _STATE_WRITER = threading.Thread(target=_state_writer, name="fpgen-state-writer")
+            _STATE_WRITER.start()
     except Exception:
         # Never break UI for persistence
         return
@@ -174,8 +235,15 @@ def _wipe_state_file_best_effort() -> None:
     """
     Delete persisted state file (if present) and clear in-memory cache.
     """
-    global _STATE_MEM
+    global _STATE_MEM, _STATE_HASH, _STATE_PENDING
     _STATE_MEM = None
+    with _STATE_LOCK:
+        _STATE_HASH = None
+        _STATE_PENDING = None
+        writer = _STATE_WRITER
+    # Let an in-flight write land first, or it would recreate the file after the delete.
+    if writer is not None:
+        writer.join(timeout=2.0)
     try:
         os.remove(_state_path())
     except Exception:
@@ -183,6 +251,58 @@ def _wipe_state_file_best_effort() -> None:
         return
 
 
+# Label endings dropped when a min/nom/max triplet is shown as one row.
+_RANGE_LABEL_SUFS = (" min", " max", " nom", " minimum", " maximum", " nominal")
+# First number in free-form user input such as "5.8mm" or "-1e-3".
+_FLOAT_RE = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
+
+def _strip_range_suffix(lbl: str) -> str:
+    s = (lbl or "").strip()
+    sl = s.lower()
+    for suf in _RANGE_LABEL_SUFS:
+        if sl.endswith(suf):
+            return s[: -len(suf)].strip()
+    return s
+
+
+class _FieldPlan(NamedTuple):
+    specs: tuple  # schema_for_kind(kind) rows: (label, path, default, choices)
+    ranges: dict  # base -> suffix -> (label, path, default) for float min/nom/max fields
+    grouped_bases: frozenset  # bases with all of min/nom/max, rendered as one row
+    grouped_paths: frozenset  # the field paths belonging to those rows
+    float_defaults: dict  # path -> float default
+
+
+@lru_cache(maxsize=None)
+def _field_plan(kind: str) -> _FieldPlan:
+    """
+    Field specs for a kind plus the range grouping derived from them.
+
+    The schema is static per kind, while the dialog rebuilds its fields on every kind switch
+    and gathers them for every hint/preview/save; the result is shared, so treat it as read-only.
+    """
+    specs = tuple(schema_for_kind(kind))
+    # Group range-style fields: <base>.(min|nom|max) into one row with 3 slots.
+    rng: dict[str, dict[str, tuple[str, Any, Any]]] = {}
+    float_defaults: dict[str, float] = {}
+    for label, path, default, choices in specs:
+        if isinstance(default, float):
+            float_defaults[str(path)] = float(default)
+        try:
+            base, suf = str(path).rsplit(".", 1)
+        except Exception:
+            continue
+        suf = suf.lower().strip()
+        if suf in ("min", "nom", "max") and isinstance(default, float) and not choices:
+            rng.setdefault(base, {})[suf] = (str(label), str(path), default)
+
+    # Only group when all three exist.
+    grouped_bases = frozenset(b for b, m in rng.items() if all(k in m for k in ("min", "nom", "max")))
+    grouped_paths = frozenset(rng[b][sfx][1] for b in grouped_bases for sfx in ("min", "nom", "max"))
+    return _FieldPlan(specs, rng, grouped_bases, grouped_paths, float_defaults)
+
+
 def _list_pretty_dirs(repo_path: str) -> Tuple[str, list[str]]:
     """
     Return (footprints_root, pretty_dirs) for this repo.
@@ -191,14 +311,18 @@ def _list_pretty_dirs(repo_path: str) -> Tuple[str, list[str]]:
     pretty: list[str] = []
     try:
         if os.path.isdir(root):
-            for name in sorted(os.listdir(root)):
-                if not name.endswith(".pretty"):
-                    continue
-                p = os.path.join(root, name)
-                if os.path.isdir(p):
-                    pretty.append(p)
+            # scandir entries carry the directory type from readdir, so only `.pretty`
+            # names that are symlinks (or on filesystems without d_type) cost a stat().
+            with os.scandir(root) as it:
+                for ent in it:
+                    try:
+                        if ent.name.endswith(".pretty") and ent.is_dir():
+                            pretty.append(ent.path)
+                    except Exception:
+                        continue
     except Exception:
         pass
+    pretty.sort()
     return root, pretty
 
 
@@ -288,13 +412,14 @@ class FootprintGeneratorDialog(wx.Dialog):
         # Library (.pretty)
         top.Add(wx.StaticText(left, label="Library"), 0, wx.ALIGN_CENTER_VERTICAL)
         out_row = wx.BoxSizer(wx.HORIZONTAL)
-        self._fp_root, pretty_dirs = _list_pretty_dirs(repo_path)
-        pretty_labels = [os.path.basename(p) for p in pretty_dirs]
-        self.out_choice = wx.Choice(left, choices=pretty_labels)
-        self._pretty_dirs = pretty_dirs
-        if pretty_dirs:
-            self.out_choice.SetSelection(0)
+        self._fp_root = os.path.join(repo_path, "Footprints")
+        self.out_choice = wx.Choice(left, choices=[])
+        self._pretty_dirs: list[str] = []
+        # Labels already in out_choice (kept in step with _pretty_dirs) for O(1) lookups.
+        self._pretty_labels: set[str] = set()
         self.out_choice.Bind(wx.EVT_CHOICE, lambda _e: self._schedule_preview_update())
+        # Footprints/ may sit on a slow or network drive: list its libraries off the UI thread.
+        _run_in_bg(lambda: _list_pretty_dirs(repo_path)[1], self._apply_pretty_dirs)
         out_row.Add(self.out_choice, 1, wx.EXPAND)
         browse = wx.Button(left, label="Browse")
         browse.Bind(wx.EVT_BUTTON, self._on_browse_out)
@@ -518,6 +643,46 @@ class FootprintGeneratorDialog(wx.Dialog):
     # UI helpers
     # --------------------------
 
+    def _apply_pretty_dirs(self, pretty_dirs, err) -> None:
+        """
+        Fill the library choice with the scanned `.pretty` dirs (background scan callback).
+
+        Entries added before the scan finished (e.g. the restored out_dir) are kept after the
+        scanned ones, and the current selection survives; otherwise the first library is selected.
+        """
+        if self._closing or err or not pretty_dirs:
+            return
+        try:
+            selected = self.out_choice.GetStringSelection()
+            dirs = list(pretty_dirs)
+            labels = [os.path.basename(p) for p in dirs]
+            seen = set(labels)
+            for label, path in zip(self.out_choice.GetItems(), self._pretty_dirs):
+                if label not in seen:
+                    dirs.append(path)
+                    labels.append(label)
+                    seen.add(label)
+            self.out_choice.SetItems(labels)
+            self._pretty_dirs = dirs
+            self._pretty_labels = seen
+            if selected in seen:
+                self.out_choice.SetStringSelection(selected)
+            else:
+                self.out_choice.SetSelection(0)
+        except Exception:
+            return
+        self._schedule_preview_update()
+
+    def _select_out_choice(self, label: str, path: str) -> None:
+        """
+        Select `label` in the library choice, appending it (for `path`) when not listed yet.
+        """
+        if label not in self._pretty_labels:
+            self.out_choice.Append(label)
+            self._pretty_dirs.append(path)
+            self._pretty_labels.add(label)
+        self.out_choice.SetStringSelection(label)
+
     def _on_browse_out(self, _evt: wx.CommandEvent) -> None:
         dlg = wx.DirDialog(self, "Select output .pretty directory", defaultPath=self._fp_root or "")
         try:
@@ -529,10 +694,7 @@ class FootprintGeneratorDialog(wx.Dialog):
             # If user selects the Footprints root, allow it but warn later.
             # Add to choice list as a custom entry.
             label = os.path.basename(path.rstrip(os.sep)) or path
-            if label not in [self.out_choice.GetString(i) for i in range(self.out_choice.GetCount())]:
-                self.out_choice.Append(label)
-                self._pretty_dirs.append(path)
-            self.out_choice.SetStringSelection(label)
+            self._select_out_choice(label, path)
             self._schedule_preview_update()
         finally:
             dlg.Destroy()
@@ -553,6 +715,8 @@ class FootprintGeneratorDialog(wx.Dialog):
                     pass
                 # IMPORTANT: EVT_CHOICE fires *after* selection changed, but our field controls
                 # still contain the previous kind's values. Persist using the tracked active kind.
+                # This must stay synchronous (not debounced): _build_fields() below replaces
+                # the controls that _persist_kind_state_best_effort() reads.
                 old_kind = str(getattr(self, "_active_kind", "") or "")
                 if old_kind:
                     self._persist_kind_state_best_effort(old_kind, update_global=False)
@@ -609,7 +773,7 @@ class FootprintGeneratorDialog(wx.Dialog):
             except Exception:
                 pass
 
-    def _clear_fields(self) -> None:
+    def _clear_fields(self, relayout: bool = True) -> None:
         try:
             self._fields_scroll.Freeze()
         except Exception:
@@ -623,46 +787,39 @@ class FootprintGeneratorDialog(wx.Dialog):
             self._range_groups = {}
         except Exception:
             pass
-        try:
-            self._fields_scroll.Layout()
-            self._fields_scroll.FitInside()
-        except Exception:
-            pass
+        if relayout:
+            try:
+                self._fields_scroll.Layout()
+                self._fields_scroll.FitInside()
+            except Exception:
+                pass
         try:
             self._fields_scroll.Thaw()
         except Exception:
             pass
 
     def _build_fields(self) -> None:
-        self._clear_fields()
-        kind = self.kind.GetStringSelection() or "soic"
-        specs = schema_for_kind(kind)
-
-        # Group range-style fields: <base>.(min|nom|max) into one row with 3 slots.
-        def _strip_range_suffix(lbl: str) -> str:
-            s = (lbl or "").strip()
-            for suf in (" min", " max", " nom", " minimum", " maximum", " nominal"):
-                if s.lower().endswith(suf):
-                    return s[: -len(suf)].strip()
-            return s
-
-        rng: dict[str, dict[str, tuple[str, Any, Any]]] = {}  # base -> suffix -> (label,path,default)
-        by_path: dict[str, tuple[str, str, Any, Any]] = {}
-        for label, path, default, choices in specs:
-            by_path[str(path)] = (str(label), str(path), default, choices)
+        # Keep the scroll area frozen across clear + create, so the dozens of new controls
+        # cost one layout/repaint instead of one per widget. Layout stays synchronous (a
+        # deferred FitInside leaves controls drawn at 0,0 until the next resize).
+        try:
+            self._fields_scroll.Freeze()
+        except Exception:
+            pass
+        try:
+            self._clear_fields(relayout=False)
+            self._create_field_controls()
+        finally:
             try:
-                base, suf = str(path).rsplit(".", 1)
+                self._fields_scroll.Thaw()
             except Exception:
-                continue
-            suf = suf.lower().strip()
-            if suf in ("min", "nom", "max") and isinstance(default, float) and not choices:
-                rng.setdefault(base, {})[suf] = (str(label), str(path), default)
+                pass
 
-        # Only group when all three exist.
-        grouped_bases = {b for b, m in rng.items() if all(k in m for k in ("min", "nom", "max"))}
-        grouped_paths = set()
-        for b in grouped_bases:
-            grouped_paths.update({rng[b]["min"][1], rng[b]["nom"][1], rng[b]["max"][1]})
+    def _create_field_controls(self) -> None:
+        kind = self.kind.GetStringSelection() or "soic"
+        plan = _field_plan(kind)
+        specs, rng = plan.specs, plan.ranges
+        grouped_bases, grouped_paths = plan.grouped_bases, plan.grouped_paths
 
         # Track range groups for dynamic nominal hints.
         self._range_groups: dict[str, dict[str, wx.TextCtrl]] = {}
@@ -863,11 +1020,7 @@ class FootprintGeneratorDialog(wx.Dialog):
         # Ensure choice list has an entry for this directory.
         label = os.path.basename(out_dir.rstrip(os.sep)) or out_dir
         try:
-            labels = [self.out_choice.GetString(i) for i in range(self.out_choice.GetCount())]
-            if label not in labels:
-                self.out_choice.Append(label)
-                self._pretty_dirs.append(out_dir)
-            self.out_choice.SetStringSelection(label)
+            self._select_out_choice(label, out_dir)
         except Exception:
             return
 
@@ -1005,7 +1158,7 @@ class FootprintGeneratorDialog(wx.Dialog):
         # Strip a common unit suffix.
         if s.endswith("mm"):
             s = s[:-2].strip()
-        m = re.search(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", s)
+        m = _FLOAT_RE.search(s)
         if not m:
             return float(fallback)
         try:
@@ -1024,12 +1177,8 @@ class FootprintGeneratorDialog(wx.Dialog):
         """
         out: Dict[str, Any] = {}
         kind = self.kind.GetStringSelection() or "soic"
-        specs = schema_for_kind(kind)
-
-        defaults_by_path: dict[str, float] = {}
-        for _lbl, pth, dflt, _ch in specs:
-            if isinstance(dflt, float):
-                defaults_by_path[str(pth)] = float(dflt)
+        plan = _field_plan(kind)
+        specs, defaults_by_path = plan.specs, plan.float_defaults
 
         for _label, path, default, choices in specs:
             ctrl = self._field_ctrls.get(path)